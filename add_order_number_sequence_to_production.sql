@@ -0,0 +1,15 @@
+-- ============================================
+-- Add the order number sequence to Production Database
+-- Run this in Supabase SQL Editor before deploying the sequence-based order numbers
+-- ============================================
+
+-- Existing numbers (ORD000001, ORD-0001, ...) use other formats, so 'ORD-' + 8 digits can't collide
+CREATE SEQUENCE IF NOT EXISTS order_number_seq;
+
+ALTER TABLE orders ALTER COLUMN order_number
+    SET DEFAULT 'ORD-' || lpad(nextval('order_number_seq')::text, 8, '0');
+
+-- Verify the default
+SELECT column_default
+FROM information_schema.columns
+WHERE table_name = 'orders' AND column_name = 'order_number';
@@ -0,0 +1,48 @@
+"""
+Composite indexes for admin filter queries
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Users list filters on role + active + verified together.
+    # On Postgres the listed display columns ride along in the leaf pages (INCLUDE),
+    # so the admin user list can be answered from the index alone.
+    op.create_index(
+        'idx_users_role_active_verified', 'users', ['role', 'is_active', 'is_verified'],
+        postgresql_include=['email', 'first_name', 'last_name']
+    )
+
+    # Menu items are filtered by category and availability status
+    op.create_index(
+        'idx_menu_items_category_status', 'menu_items', ['category_id', 'status'],
+        postgresql_include=['name', 'price']
+    )
+
+    # Orders are filtered by status and listed newest first
+    op.create_index(
+        'idx_orders_status_created_at', 'orders', ['status', 'created_at'],
+        postgresql_include=['order_number', 'total_amount']
+    )
+
+    # Payment state lives on payments, not orders; look it up per order
+    op.create_index(
+        'idx_payments_order_status', 'payments', ['order_id', 'status'],
+        postgresql_include=['payment_method', 'amount']
+    )
+
+def downgrade():
+    op.drop_index('idx_payments_order_status')
+    op.drop_index('idx_orders_status_created_at')
+    op.drop_index('idx_menu_items_category_status')
+    op.drop_index('idx_users_role_active_verified')
@@ -0,0 +1,45 @@
+"""
+Store monetary amounts as NUMERIC(10, 2) instead of double precision
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+MONEY_COLUMNS = [
+    ('menu_items', 'price'),
+    ('orders', 'subtotal'),
+    ('orders', 'tax_amount'),
+    ('orders', 'discount_amount'),
+    ('orders', 'total_amount'),
+    ('order_items', 'unit_price'),
+    ('order_items', 'total_price'),
+    ('payments', 'amount'),
+]
+
+def upgrade():
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Numeric(10, 2),
+            existing_type=sa.Float,
+            postgresql_using=f'round({column}::numeric, 2)'
+        )
+
+def downgrade():
+    for table, column in reversed(MONEY_COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.Float,
+            existing_type=sa.Numeric(10, 2),
+            postgresql_using=f'{column}::double precision'
+        )
@@ -0,0 +1,53 @@
+"""
+Store JSON payloads as JSONB instead of TEXT
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = [
+    ('users', 'dietary_preferences'),
+    ('users', 'notification_preferences'),
+    ('menu_items', 'ingredients'),
+    ('menu_items', 'allergens'),
+    ('menu_items', 'dietary_tags'),
+    ('menu_items', 'customization_options'),
+    ('order_items', 'customizations'),
+    ('notifications', 'metadata'),
+    ('reviews', 'photos'),
+    ('staff_accounts', 'permissions'),
+]
+
+def upgrade():
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB,
+            existing_type=sa.Text,
+            postgresql_using=f'"{column}"::jsonb'
+        )
+
+    # Tag filters use containment (dietary_tags @> '["vegan"]'), which GIN serves
+    op.create_index('idx_menu_items_dietary_tags', 'menu_items', ['dietary_tags'], postgresql_using='gin')
+
+def downgrade():
+    op.drop_index('idx_menu_items_dietary_tags')
+
+    for table, column in reversed(JSON_COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.Text,
+            existing_type=postgresql.JSONB,
+            postgresql_using=f'"{column}"::text'
+        )
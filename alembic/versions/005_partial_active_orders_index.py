@@ -0,0 +1,34 @@
+"""
+Replace the full orders(status) index with a partial index over in-flight orders
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+# Completed and cancelled orders make up most rows over time but are never
+# looked up by status, so only the in-flight statuses are indexed
+ACTIVE_ORDERS = sa.text(
+    "status IN ('pending_payment', 'payment_confirmed', 'preparing', 'almost_ready', 'ready_for_pickup')"
+)
+
+def upgrade():
+    op.drop_index('idx_orders_status')
+    op.create_index(
+        'idx_orders_active', 'orders', ['status', 'created_at'],
+        postgresql_where=ACTIVE_ORDERS,
+        sqlite_where=ACTIVE_ORDERS
+    )
+
+def downgrade():
+    op.drop_index('idx_orders_active')
+    op.create_index('idx_orders_status', 'orders', ['status'])
@@ -0,0 +1,24 @@
+"""
+Order number lookups: no extra index (kept as a placeholder revision)
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-14
+
+"""
+
+# revision identifiers
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # A hash index on order_number was planned here. Postgres hash indexes cannot be
+    # UNIQUE, so it could only sit beside the unique btree, which already answers the
+    # equality lookups; it would double the index upkeep on every order insert for no
+    # measurable read gain. The revision is kept so 007 onwards still chain from it.
+    pass
+
+def downgrade():
+    pass
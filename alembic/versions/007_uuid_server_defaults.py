@@ -0,0 +1,48 @@
+"""
+Generate UUID primary keys in the database with gen_random_uuid()
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+UUID_TABLES = [
+    'users',
+    'menu_categories',
+    'menu_items',
+    'orders',
+    'order_items',
+    'payments',
+    'notifications',
+    'reviews',
+    'staff_accounts',
+]
+
+def upgrade():
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto provides it on older servers
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+
+    for table in UUID_TABLES:
+        op.alter_column(
+            table, 'id',
+            existing_type=postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()')
+        )
+
+def downgrade():
+    for table in reversed(UUID_TABLES):
+        op.alter_column(
+            table, 'id',
+            existing_type=postgresql.UUID(as_uuid=True),
+            server_default=None
+        )
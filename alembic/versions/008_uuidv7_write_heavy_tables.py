@@ -0,0 +1,39 @@
+"""
+Time-ordered UUIDv7 keys for the write-heavy tables
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+# New rows land at the right edge of the primary key btree instead of on random
+# leaf pages, so inserts keep touching the same few hot pages
+WRITE_HEAVY_TABLES = ['order_items', 'notifications', 'payments']
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_uuidv7')
+
+    for table in WRITE_HEAVY_TABLES:
+        op.alter_column(
+            table, 'id',
+            existing_type=postgresql.UUID(as_uuid=True),
+            server_default=sa.text('uuid_generate_v7()')
+        )
+
+def downgrade():
+    for table in reversed(WRITE_HEAVY_TABLES):
+        op.alter_column(
+            table, 'id',
+            existing_type=postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()')
+        )
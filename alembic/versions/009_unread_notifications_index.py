@@ -0,0 +1,32 @@
+"""
+Partial index for a user's most recent unread notifications
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+UNREAD = sa.text('is_read = false')
+
+def upgrade():
+    # "Latest N unread for user X" reads the first N entries of the index, already in order
+    op.drop_index('idx_notifications_user_read')
+    op.create_index(
+        'idx_notifications_user_unread_recent', 'notifications',
+        ['user_id', sa.text('created_at DESC')],
+        postgresql_where=UNREAD,
+        sqlite_where=UNREAD
+    )
+
+def downgrade():
+    op.drop_index('idx_notifications_user_unread_recent')
+    op.create_index('idx_notifications_user_read', 'notifications', ['user_id', 'is_read'])
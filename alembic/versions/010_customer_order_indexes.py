@@ -0,0 +1,30 @@
+"""
+Composite index for a customer's orders and an index on order_items.order_id
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # "Orders for customer X (in status Y), newest first" is one range scan
+    op.create_index(
+        'idx_orders_customer_status_created', 'orders',
+        ['customer_id', 'status', 'created_at'],
+        postgresql_using='btree'
+    )
+
+    # Postgres doesn't index foreign keys on its own; line items are always read by order
+    op.create_index('idx_order_items_order_id', 'order_items', ['order_id'], postgresql_using='btree')
+
+def downgrade():
+    op.drop_index('idx_order_items_order_id')
+    op.drop_index('idx_orders_customer_status_created')
@@ -0,0 +1,43 @@
+"""
+Align the paymentstatus enum with the application's PaymentStatus values
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+def _swap_payment_status_type(values, mapping):
+    """Rebuild the paymentstatus type with new values, translating existing rows via mapping"""
+    labels = ", ".join(f"'{value}'" for value in values)
+    cases = " ".join(f"WHEN '{old}' THEN '{new}'" for old, new in mapping.items())
+
+    op.execute(f"CREATE TYPE paymentstatus_new AS ENUM ({labels})")
+    op.execute("ALTER TABLE payments ALTER COLUMN status DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE payments ALTER COLUMN status TYPE paymentstatus_new "
+        f"USING (CASE status::text {cases} ELSE status::text END)::paymentstatus_new"
+    )
+    op.execute("DROP TYPE paymentstatus")
+    op.execute("ALTER TYPE paymentstatus_new RENAME TO paymentstatus")
+    op.execute("ALTER TABLE payments ALTER COLUMN status SET DEFAULT 'pending'")
+
+def upgrade():
+    _swap_payment_status_type(
+        ('pending', 'completed', 'failed', 'refunded'),
+        {'confirmed': 'completed', 'rejected': 'failed'}
+    )
+
+def downgrade():
+    # Refunds had no equivalent before; they were rejections from the customer's point of view
+    _swap_payment_status_type(
+        ('pending', 'confirmed', 'rejected'),
+        {'completed': 'confirmed', 'failed': 'rejected', 'refunded': 'rejected'}
+    )
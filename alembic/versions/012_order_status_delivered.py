@@ -0,0 +1,40 @@
+"""
+Add 'delivered' to the orderstatus enum
+
+The models now map status columns onto the native userrole/orderstatus/
+menuitemstatus/paymentstatus types; OrderStatus.DELIVERED was the one value
+this schema's enum was missing.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.execute("ALTER TYPE orderstatus ADD VALUE IF NOT EXISTS 'delivered' BEFORE 'completed'")
+
+def downgrade():
+    # Postgres can't drop an enum value; rebuild the type without it
+    op.drop_index('idx_orders_active')
+    op.execute("UPDATE orders SET status = 'completed' WHERE status = 'delivered'")
+    op.execute(
+        "CREATE TYPE orderstatus_old AS ENUM ('pending_payment', 'payment_confirmed', 'preparing', "
+        "'almost_ready', 'ready_for_pickup', 'completed', 'cancelled')"
+    )
+    op.execute("ALTER TABLE orders ALTER COLUMN status DROP DEFAULT")
+    op.execute("ALTER TABLE orders ALTER COLUMN status TYPE orderstatus_old USING status::text::orderstatus_old")
+    op.execute("DROP TYPE orderstatus")
+    op.execute("ALTER TYPE orderstatus_old RENAME TO orderstatus")
+    op.execute("ALTER TABLE orders ALTER COLUMN status SET DEFAULT 'pending_payment'")
+    op.execute(
+        "CREATE INDEX idx_orders_active ON orders (status, created_at) WHERE status IN "
+        "('pending_payment', 'payment_confirmed', 'preparing', 'almost_ready', 'ready_for_pickup')"
+    )
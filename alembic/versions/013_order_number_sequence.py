@@ -0,0 +1,27 @@
+"""
+Generate order numbers from a sequence inside the INSERT
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Earlier numbers used other formats (ORD000001, ORD-0001), so 'ORD-' + 8 digits can't collide
+    op.execute("CREATE SEQUENCE order_number_seq")
+    op.execute(
+        "ALTER TABLE orders ALTER COLUMN order_number "
+        "SET DEFAULT 'ORD-' || lpad(nextval('order_number_seq')::text, 8, '0')"
+    )
+
+def downgrade():
+    op.execute("ALTER TABLE orders ALTER COLUMN order_number DROP DEFAULT")
+    op.execute("DROP SEQUENCE order_number_seq")
@@ -1,132 +1,236 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy import JSON, Float, String, Text, and_, bindparam, case, cast, func, desc, literal, select, tuple_, update
 from typing import Optional
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
 import os
+import tempfile
+import traceback
+from time import monotonic
 
+from .core.config import settings
 from .core.database import get_db
-from app.models.database_models import User, Order, OrderItem, MenuItem, BankTransfer, MenuCategory
+from app.auth.auth import AuthService, DUMMY_PASSWORD_HASH
+from app.models.database_models import AppSettings, User, Order, OrderItem, MenuItem, BankTransfer, MenuCategory
 from app.models.database_models import OrderStatus as OrderStatusEnum
 from app.models.database_models import PaymentStatus as PaymentStatusEnum
 from app.models.database_models import UserRole
+from app.websockets import notify_order_status_change, notify_payment_status_change
 
-# Create admin router
-admin_router = APIRouter()
+# Create admin router; JSON endpoints serialize through orjson (HTML pages set their own class)
+admin_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Setup templates directory
 templates_dir = os.path.join(os.path.dirname(__file__), "templates")
 if not os.path.exists(templates_dir):
     os.makedirs(templates_dir)
 
-templates = Jinja2Templates(directory=templates_dir)
+# Explicit environment: no mtime checks outside debug, compiled templates kept across restarts
+jinja_cache_dir = os.path.join(tempfile.gettempdir(), "vendorr_jinja_cache")
+os.makedirs(jinja_cache_dir, exist_ok=True)
+
+template_env = Environment(
+    loader=FileSystemLoader(templates_dir),
+    autoescape=True,
+    auto_reload=settings.debug,
+    cache_size=-1,  # Never evict: the admin template set is small and fixed
+    bytecode_cache=FileSystemBytecodeCache(jinja_cache_dir)
+)
+templates = Jinja2Templates(env=template_env)
+
+# Parse every admin page now instead of on its first request
+for template_name in template_env.list_templates(filter_func=lambda name: name.startswith("admin_")):
+    template_env.get_template(template_name)
+
+# The login page has a constant context, so render it once; only the error variant is dynamic
+LOGIN_HTML = template_env.get_template("admin_login.html").render(page_title="Admin Login").encode()
+
+# Accepted values for the status update endpoints
+VALID_ORDER_STATUSES = frozenset(status.value for status in OrderStatusEnum)
+VALID_PAYMENT_STATUSES = frozenset(status.value for status in PaymentStatusEnum)
+
+# Orders awaiting kitchen/payment work, bound once as a single expanding IN parameter
+PENDING_STATUSES = bindparam(
+    "pending_statuses",
+    value=[OrderStatusEnum.PENDING_PAYMENT.value, OrderStatusEnum.PAYMENT_CONFIRMED.value, OrderStatusEnum.PREPARING.value],
+    expanding=True
+)
+
+# Dashboard stats move on order timescales; reuse them for a few seconds across page loads
+DASHBOARD_STATS_TTL = 15  # seconds
+_dashboard_stats_cache = {}  # date.isoformat() -> (computed_at, stats)
+
+def clear_dashboard_stats_cache():
+    """Drop cached dashboard stats after a write that changes them"""
+    _dashboard_stats_cache.clear()
 
 # Database-connected functions (replacing mock data)
 def get_dashboard_stats(db: Session):
-    today = date.today()
-
-    total_users = db.query(User).filter(User.role == UserRole.CUSTOMER).count()
-    total_orders = db.query(Order).count()
-    total_menu_items = db.query(MenuItem).count()
-    today_orders = db.query(Order).filter(
-        func.date(Order.created_at) == today
-    ).count()
-
-    pending_orders = db.query(Order).filter(
-        Order.status.in_(["pending_payment", "payment_confirmed", "preparing"])
-    ).count()
-
-    completed_orders = db.query(Order).filter(
-        Order.status == "completed"
-    ).count()
-
-    total_revenue = db.query(func.sum(Order.total_amount)).filter(
-        Order.payment_status == "completed"
-    ).scalar() or 0
-
-    today_revenue = db.query(func.sum(Order.total_amount)).filter(
-        func.date(Order.created_at) == today,
-        Order.payment_status == "completed"
-    ).scalar() or 0
-
-    return {
+    cache_key = date.today().isoformat()
+    cached = _dashboard_stats_cache.get(cache_key)
+    now = monotonic()
+    if cached and now - cached[0] < DASHBOARD_STATS_TTL:
+        return cached[1]
+
+    # Half-open range on the raw column so the created_at indexes stay usable
+    today_start = datetime.combine(date.today(), time.min)
+    is_today = and_(Order.created_at >= today_start, Order.created_at < today_start + timedelta(days=1))
+    is_paid = Order.payment_status == "completed"
+
+    # One pass over orders with conditional aggregates instead of a query per metric
+    (
+        total_orders,
+        today_orders,
+        pending_orders,
+        completed_orders,
+        total_revenue,
+        today_revenue
+    ) = db.query(
+        func.count(Order.id),
+        func.count(case((is_today, 1))),
+        func.count(case((Order.status.in_(PENDING_STATUSES), 1))),
+        func.count(case((Order.status == "completed", 1))),
+        func.sum(case((is_paid, Order.total_amount), else_=0)),
+        func.sum(case((and_(is_today, is_paid), Order.total_amount), else_=0))
+    ).one()
+
+    # Other tables: counts as scalar subqueries in a second round-trip. These stay exact: menu_items is
+    # small, and pg_class.reltuples only refreshes on VACUUM/ANALYZE, so the menu total would lag edits
+    total_users, total_menu_items = db.query(
+        select(func.count(User.id)).where(User.role == UserRole.CUSTOMER).scalar_subquery(),
+        select(func.count(MenuItem.id)).scalar_subquery()
+    ).one()
+
+    stats = {
         "total_users": total_users,
         "total_orders": total_orders,
         "total_menu_items": total_menu_items,
         "today_orders": today_orders,
         "pending_orders": pending_orders,
         "completed_orders": completed_orders,
-        "total_revenue": float(total_revenue),
-        "today_revenue": float(today_revenue)
+        "total_revenue": float(total_revenue or 0),
+        "today_revenue": float(today_revenue or 0)
     }
 
-def get_recent_orders(db: Session, limit: int = 20):
-    orders = db.query(Order).options(
-        joinedload(Order.customer),
-        joinedload(Order.order_items).joinedload(OrderItem.menu_item)
-    ).order_by(desc(Order.created_at)).limit(limit).all()
-
-    result = []
-    for order in orders:
-        # Get order items summary
-        items_summary = ", ".join([
-            f"{item.quantity}x {item.menu_item.name}"
-            for item in order.order_items
-        ]) if order.order_items else "No items"
-
-        result.append({
-            "id": order.id,
-            "order_number": order.order_number,
-            "customer": f"{order.customer.first_name} {order.customer.last_name}" if order.customer else order.customer_name,
-            "customer_email": order.customer.email if order.customer else order.customer_email,
-            "items": items_summary,
-            "total": float(order.total_amount) if order.total_amount else 0,
-            "status": order.status,  # Already a string
-            "payment_status": order.payment_status,  # Already a string
-            "created_at": order.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            "bank_transfer_receipt": order.bank_transfer_receipt
-        })
+    # Only today's key is ever read again, so older days are dropped
+    _dashboard_stats_cache.clear()
+    _dashboard_stats_cache[cache_key] = (now, stats)
+    return stats
+
+def sql_datetime(db: Session, column, with_time: bool = True):
+    """Format a timestamp column in SQL ("YYYY-MM-DD[ HH:MM:SS]") using the bound dialect"""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.to_char(column, "YYYY-MM-DD HH24:MI:SS" if with_time else "YYYY-MM-DD")
+    return func.strftime("%Y-%m-%d %H:%M:%S" if with_time else "%Y-%m-%d", column)
+
+def sql_string_agg(db: Session, expression, separator: str):
+    """Concatenate one string per row, separated, using the bound dialect"""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.string_agg(expression, separator)
+    return func.group_concat(expression, separator)
+
+def sql_json_object(db: Session, fields: dict):
+    """Build a JSON object in SQL from {key: column expression} using the bound dialect"""
+    build = func.json_build_object if db.get_bind().dialect.name == "postgresql" else func.json_object
+    return build(*[arg for key, value in fields.items() for arg in (literal(key), value)])
+
+def sql_json_array_agg(db: Session, element):
+    """Aggregate one JSON element per row into a JSON array"""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.json_agg(element)
+    return func.json_group_array(element)
+
+def sql_json_embed(db: Session, subquery):
+    """Nest a JSON array subquery inside an outer JSON object ([] when it has no rows)"""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.coalesce(subquery, cast(literal("[]"), JSON))
+    # SQLite drops the JSON subtype across the subquery boundary; json() restores it
+    return func.json(subquery)
 
-    return result
+def get_recent_orders(db: Session, limit: int = 20):
+    # Flat column projection: display strings and the items summary are built by the database
+    items_summary = (
+        select(sql_string_agg(
+            db,
+            cast(OrderItem.quantity, String) + "x " + func.coalesce(MenuItem.name, "Unknown Item"),
+            ", "
+        ))
+        .select_from(OrderItem)
+        .outerjoin(MenuItem, MenuItem.id == OrderItem.menu_item_id)
+        .where(OrderItem.order_id == Order.id)
+        .scalar_subquery()
+    )
+    rows = db.query(
+        Order.id,
+        Order.order_number,
+        case((User.id.isnot(None), User.full_name), else_=Order.customer_name).label("customer"),
+        func.coalesce(User.email, Order.customer_email).label("customer_email"),
+        func.coalesce(items_summary, "No items").label("items"),
+        func.coalesce(cast(Order.total_amount, Float), 0).label("total"),
+        Order.status,  # Already a string
+        Order.payment_status,  # Already a string
+        sql_datetime(db, Order.created_at).label("created_at"),
+        Order.bank_transfer_receipt
+    ).outerjoin(User, User.id == Order.customer_id).order_by(desc(Order.created_at)).limit(limit).all()
+
+    return [dict(row._mapping) for row in rows]
 
 def get_menu_items_from_db(db: Session):
-    menu_items = db.query(MenuItem).join(MenuCategory).order_by(MenuItem.name).all()
-
-    result = []
-    for item in menu_items:
-        result.append({
-            "id": item.id,
-            "name": item.name,
-            "description": item.description,
-            "category": item.category.name,
-            "price": item.price,
-            "available": item.is_available,
-            "is_featured": item.is_featured,
-            "preparation_time": item.preparation_time,
-            "created_at": item.created_at.strftime("%Y-%m-%d")
-        })
-
-    return result
-
-def get_users_from_db(db: Session):
-    users = db.query(User).order_by(desc(User.created_at)).all()
-
-    result = []
-    for user in users:
-        result.append({
-            "id": user.id,
-            "name": f"{user.first_name} {user.last_name}",
-            "email": user.email,
-            "phone": user.phone,
-            "role": user.role,  # Already a string
-            "active": user.is_active,
-            "email_verified": user.is_verified,
-            "created_at": user.created_at.strftime("%Y-%m-%d")
-        })
-
-    return result
+    rows = db.query(
+        MenuItem.id,
+        MenuItem.name,
+        MenuItem.description,
+        MenuCategory.name.label("category"),
+        cast(MenuItem.price, Float).label("price"),
+        MenuItem.is_available.label("available"),
+        MenuItem.is_featured,
+        MenuItem.preparation_time,
+        sql_datetime(db, MenuItem.created_at, with_time=False).label("created_at")
+    ).join(MenuCategory).order_by(MenuItem.name).all()
+
+    return [dict(row._mapping) for row in rows]
+
+USERS_PAGE_SIZE = 50
+
+def get_users_from_db(db: Session, cursor: Optional[int] = None, limit: int = USERS_PAGE_SIZE):
+    """One page of users, newest first; cursor is the id of the last user on the previous page"""
+    query = db.query(
+        User.id,
+        User.full_name.label("name"),
+        User.email,
+        User.phone,
+        User.role,  # Already a string
+        User.is_active.label("active"),
+        User.is_verified.label("email_verified"),
+        sql_datetime(db, User.created_at, with_time=False).label("created_at")
+    )
+    if cursor is not None and db.query(User.id).filter(User.id == cursor).first() is None:
+        # The cursor user was deleted since the page was rendered: start over rather than show nothing
+        cursor = None
+    if cursor is not None:
+        # Keyset: continue strictly after (created_at, id) of the cursor row, served by ix_users_created_at_id
+        cursor_created_at = select(User.created_at).where(User.id == cursor).scalar_subquery()
+        query = query.filter(tuple_(User.created_at, User.id) < tuple_(cursor_created_at, cursor))
+
+    # One extra row tells whether another page exists
+    rows = query.order_by(desc(User.created_at), desc(User.id)).limit(limit + 1).all()
+    users = [dict(row._mapping) for row in rows[:limit]]
+    next_cursor = users[-1]["id"] if len(rows) > limit else None
+    return users, next_cursor
+
+def get_user_stats(db: Session):
+    """Header counts for the users page, over all users rather than the current page"""
+    total, active, customers = db.query(
+        func.count(User.id),
+        func.count(case((User.is_active.is_(True), 1))),
+        func.count(case((User.role == UserRole.CUSTOMER.value, 1)))
+    ).one()
+    return {"total": total, "active": active, "customers": customers, "staff": total - customers}
 
 # Admin authentication check (basic example)
 def get_current_admin_user(request: Request):
@@ -194,11 +298,9 @@ async def admin_orders(request: Request, db: Session = Depends(get_db)):
         "username": request.session.get("admin_username", "admin"),
         "role": "admin"
     }
-    orders = get_recent_orders(db, limit=50)  # Get more orders for management
-
+    # Rows are fetched by the page from /admin/api/orders and rendered client-side
     return templates.TemplateResponse("admin_orders.html", {
         "request": request,
-        "orders": orders,
         "page_title": "Order Management",
         "admin_user": admin_user
     })
@@ -227,7 +329,7 @@ async def admin_menu(request: Request, db: Session = Depends(get_db)):
     })
 
 @admin_router.get("/users", response_class=HTMLResponse)
-async def admin_users(request: Request, db: Session = Depends(get_db)):
+async def admin_users(request: Request, cursor: Optional[int] = None, db: Session = Depends(get_db)):
     """User Management - Manage customer and staff accounts"""
     try:
         if not is_admin_authenticated(request):
@@ -240,11 +342,14 @@ async def admin_users(request: Request, db: Session = Depends(get_db)):
         "username": request.session.get("admin_username", "admin"),
         "role": "admin"
     }
-    users = get_users_from_db(db)
+    users, next_cursor = get_users_from_db(db, cursor=cursor)
 
     return templates.TemplateResponse("admin_users.html", {
         "request": request,
         "users": users,
+        "user_stats": get_user_stats(db),
+        "cursor": cursor,
+        "next_cursor": next_cursor,
         "page_title": "User Management",
         "admin_user": admin_user
     })
@@ -260,7 +365,6 @@ async def admin_settings(request: Request, db: Session = Depends(get_db)):
         "username": request.session.get("admin_username", "admin"),
         "role": "admin"
     }
-    from app.models.database_models import AppSettings
 
     # Get or create settings
     settings = db.query(AppSettings).first()
@@ -268,7 +372,6 @@ async def admin_settings(request: Request, db: Session = Depends(get_db)):
         settings = AppSettings()
         db.add(settings)
         db.commit()
-        db.refresh(settings)
 
     return templates.TemplateResponse("admin_settings.html", {
         "request": request,
@@ -290,8 +393,6 @@ async def admin_settings_update(
     admin_user=Depends(get_current_admin_user)
 ):
     """Update Settings"""
-    from app.models.database_models import AppSettings
-
     # Get or create settings
     settings = db.query(AppSettings).first()
     if not settings:
@@ -305,7 +406,6 @@ async def admin_settings_update(
     settings.restaurant_phone = restaurant_phone
     settings.restaurant_email = restaurant_email
     settings.restaurant_address = restaurant_address
-    settings.updated_at = datetime.utcnow()
 
     db.commit()
 
@@ -315,10 +415,7 @@ async def admin_settings_update(
 @admin_router.get("/login", response_class=HTMLResponse)
 async def admin_login_page(request: Request):
     """Admin Login Page"""
-    return templates.TemplateResponse("admin_login.html", {
-        "request": request,
-        "page_title": "Admin Login"
-    })
+    return Response(content=LOGIN_HTML, media_type="text/html")
 
 
 @admin_router.get("", response_class=HTMLResponse)
@@ -334,16 +431,14 @@ async def admin_root(request: Request, db: Session = Depends(get_db)):
 @admin_router.post("/login")
 async def admin_login(request: Request, username: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
     """Handle admin login"""
-    from app.auth.auth import AuthService
-
     # Find user by email (username field is used for email)
-    user = db.query(User).filter(User.email == username).first()
+    user = db.query(User.id, User.email, User.role, User.hashed_password).filter(User.email == username).first()
 
-    # Check if user exists, is admin, and password is correct
-    if (user and
-        user.role == UserRole.ADMIN.value and
-        user.hashed_password and
-        AuthService.verify_password(password, user.hashed_password)):
+    # Always run exactly one bcrypt check so unknown, non-admin and admin accounts take the same time
+    is_admin = bool(user and user.role == UserRole.ADMIN.value and user.hashed_password)
+    password_ok = AuthService.verify_password(password, user.hashed_password if is_admin else DUMMY_PASSWORD_HASH)
+
+    if is_admin and password_ok:
         request.session["admin_logged_in"] = True
         request.session["admin_username"] = user.email
         request.session["admin_user_id"] = user.id
@@ -368,6 +463,15 @@ async def admin_logout(request: Request):
     return RedirectResponse(url="/admin/login", status_code=303)
 
 # API endpoints for admin operations
+@admin_router.get("/api/orders")
+async def list_orders(
+    limit: int = 50,
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_current_admin_user)
+):
+    """Recent orders as JSON for the order management table"""
+    return {"orders": get_recent_orders(db, limit=min(max(limit, 1), 200))}
+
 @admin_router.get("/api/orders/{order_id}")
 async def get_order_details(
     order_id: int,
@@ -376,51 +480,56 @@ async def get_order_details(
 ):
     """Get detailed order information"""
     try:
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if not order:
+        # The whole payload (items included) is assembled as JSON by the database
+        item_json = sql_json_object(db, {
+            "id": OrderItem.id,
+            "name": func.coalesce(MenuItem.name, "Unknown Item"),
+            "quantity": OrderItem.quantity,
+            "unit_price": func.coalesce(cast(OrderItem.unit_price, Float), 0),
+            "subtotal": func.coalesce(cast(OrderItem.total_price, Float), 0),
+            "special_instructions": cast(OrderItem.customizations, Text),
+        })
+        items = (
+            select(sql_json_array_agg(db, item_json))
+            .select_from(OrderItem)
+            .outerjoin(MenuItem, MenuItem.id == OrderItem.menu_item_id)
+            .where(OrderItem.order_id == Order.id)
+            .scalar_subquery()
+        )
+        has_customer = User.id.isnot(None)
+        order_json = sql_json_object(db, {
+            "id": Order.id,
+            "order_number": Order.order_number,
+            "customer_name": case((has_customer, func.trim(User.full_name)), else_="Unknown"),
+            "customer_email": case((has_customer, User.email), else_=""),
+            "customer_phone": case((has_customer, User.phone), else_=""),
+            "status": Order.status,
+            "payment_status": Order.payment_status,
+            "payment_method": Order.payment_method,
+            "payment_reference": Order.payment_reference,
+            "bank_transfer_receipt": Order.bank_transfer_receipt,
+            "subtotal": func.coalesce(cast(Order.subtotal, Float), 0),
+            "tax": func.coalesce(cast(Order.tax_amount, Float), 0),
+            "delivery_fee": 0,  # Not in current model
+            "total": func.coalesce(cast(Order.total_amount, Float), 0),
+            "special_instructions": Order.notes,
+            "created_at": func.coalesce(sql_datetime(db, Order.created_at), ""),
+            "items": sql_json_embed(db, items),
+        })
+        payload = db.execute(
+            select(cast(order_json, Text))
+            .select_from(Order)
+            .outerjoin(User, User.id == Order.customer_id)
+            .where(Order.id == order_id)
+        ).scalar()
+        if payload is None:
             raise HTTPException(status_code=404, detail="Order not found")
 
-        # Get customer info
-        customer = db.query(User).filter(User.id == order.customer_id).first()
-
-        # Get order items with menu item details
-        order_items = db.query(OrderItem).filter(OrderItem.order_id == order_id).all()
-        items_list = []
-        for item in order_items:
-            menu_item = db.query(MenuItem).filter(MenuItem.id == item.menu_item_id).first()
-            items_list.append({
-                "id": item.id,
-                "name": menu_item.name if menu_item else "Unknown Item",
-                "quantity": item.quantity,
-                "unit_price": float(item.unit_price) if item.unit_price else 0,
-                "subtotal": float(item.total_price) if item.total_price else 0,
-                "special_instructions": item.customizations if item.customizations else None
-            })
-
-        return {
-            "id": order.id,
-            "order_number": order.order_number,
-            "customer_name": f"{customer.first_name or ''} {customer.last_name or ''}".strip() if customer else "Unknown",
-            "customer_email": customer.email if customer else "",
-            "customer_phone": customer.phone if customer else "",
-            "status": order.status,
-            "payment_status": order.payment_status,
-            "payment_method": order.payment_method,
-            "payment_reference": order.payment_reference,
-            "bank_transfer_receipt": order.bank_transfer_receipt,
-            "subtotal": float(order.subtotal) if order.subtotal else 0,
-            "tax": float(order.tax_amount) if order.tax_amount else 0,
-            "delivery_fee": 0,  # Not in current model
-            "total": float(order.total_amount) if order.total_amount else 0,
-            "special_instructions": order.notes,
-            "created_at": order.created_at.strftime("%Y-%m-%d %H:%M:%S") if order.created_at else "",
-            "items": items_list
-        }
+        return Response(content=payload, media_type="application/json")
 
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         error_detail = f"{str(e)}\n{traceback.format_exc()}"
         print(f"Error getting order details for order {order_id}: {error_detail}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -433,32 +542,31 @@ async def update_order_status(
     admin_user=Depends(get_current_admin_user)
 ):
     """Update order status"""
-    from app.websockets import notify_order_status_change
-
     try:
         # Get the new status from request body
         body = await request.json()
         new_status = body.get("status")
 
         # Validate status
-        valid_statuses = [status.value for status in OrderStatusEnum]
-        if new_status not in valid_statuses:
+        if new_status not in VALID_ORDER_STATUSES:
             raise HTTPException(status_code=400, detail="Invalid status")
 
-        # Find and update the order
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if not order:
-            raise HTTPException(status_code=404, detail="Order not found")
-
-        # Update the status
-        order.status = new_status
-        order.updated_at = datetime.utcnow()
+        # Update in place and get back only what the notification needs (updated_at via onupdate)
+        values = {"status": new_status}
 
         # Set ready time if status is READY_FOR_PICKUP
         if new_status == "ready_for_pickup":
-            order.actual_ready_time = datetime.utcnow()
+            values["actual_ready_time"] = func.now()
+
+        order = db.execute(
+            update(Order).where(Order.id == order_id).values(**values)
+            .returning(Order.id, Order.customer_id, Order.order_number)
+        ).first()
+        if not order:
+            raise HTTPException(status_code=404, detail="Order not found")
 
         db.commit()
+        clear_dashboard_stats_cache()
 
         # Send real-time notification to customer
         try:
@@ -486,36 +594,38 @@ async def update_payment_status(
     admin_user=Depends(get_current_admin_user)
 ):
     """Update order payment status"""
-    from app.websockets import notify_payment_status_change, notify_order_status_change
-
     try:
         # Get the new payment status from request body
         body = await request.json()
         new_payment_status = body.get("payment_status")
 
         # Validate payment status
-        valid_statuses = [status.value for status in PaymentStatusEnum]
-        if new_payment_status not in valid_statuses:
+        if new_payment_status not in VALID_PAYMENT_STATUSES:
             raise HTTPException(status_code=400, detail="Invalid payment status")
 
-        # Find and update the order
-        order = db.query(Order).filter(Order.id == order_id).first()
+        # Update the payment status in place (updated_at via onupdate)
+        order = db.execute(
+            update(Order).where(Order.id == order_id).values(payment_status=new_payment_status)
+            .returning(Order.id, Order.customer_id, Order.order_number)
+        ).first()
         if not order:
             raise HTTPException(status_code=404, detail="Order not found")
 
-        # Update the payment status
-        order.payment_status = new_payment_status
-        order.updated_at = datetime.utcnow()
-
         # If payment completed, also update order status if still pending
         order_status_changed = False
-        if new_payment_status == "completed" and order.status == "pending_payment":
-            order.status = "payment_confirmed"
-            order_status_changed = True
+        if new_payment_status == "completed":
+            order_status_changed = db.execute(
+                update(Order)
+                .where(Order.id == order_id, Order.status == "pending_payment")
+                .values(status="payment_confirmed")
+                .returning(Order.id)
+            ).first() is not None
 
         db.commit()
+        clear_dashboard_stats_cache()
 
-        # Send real-time notifications to customer
+        # Send real-time notifications to customer; both go to the same sockets, so they stay
+        # sequential to keep the payment update ahead of the order status change
         await notify_payment_status_change(
             order_id=order.id,
             customer_id=order.customer_id,
@@ -546,8 +656,17 @@ async def get_payment_proof(
 ):
     """Get payment proof for an order"""
     try:
-        # Find the bank transfer record
-        bank_transfer = db.query(BankTransfer).filter(BankTransfer.order_id == order_id).first()
+        # Find the bank transfer record; only the columns returned below are selected
+        bank_transfer = db.query(
+            BankTransfer.reference_number,
+            cast(BankTransfer.transfer_amount, Float).label("amount"),
+            BankTransfer.sender_name,
+            BankTransfer.transfer_date,
+            BankTransfer.receipt_image_path,
+            BankTransfer.is_confirmed,
+            BankTransfer.confirmation_notes,
+            BankTransfer.created_at
+        ).filter(BankTransfer.order_id == order_id).first()
 
         if not bank_transfer:
             raise HTTPException(status_code=404, detail="No payment proof found for this order")
@@ -557,12 +676,12 @@ async def get_payment_proof(
             "reference_number": bank_transfer.reference_number,
             "amount": bank_transfer.amount,
             "sender_name": bank_transfer.sender_name,
-            "sender_account": bank_transfer.sender_account,
+            "sender_account": None,  # Not in current model
             "transfer_date": bank_transfer.transfer_date.isoformat() if bank_transfer.transfer_date else None,
-            "receipt_image_url": bank_transfer.receipt_image_url,
-            "verification_status": bank_transfer.verification_status,
-            "notes": bank_transfer.notes,
-            "created_at": bank_transfer.created_at.isoformat()
+            "receipt_image_url": bank_transfer.receipt_image_path,
+            "verification_status": "confirmed" if bank_transfer.is_confirmed else "pending",
+            "notes": bank_transfer.confirmation_notes,
+            "created_at": bank_transfer.created_at.isoformat() if bank_transfer.created_at else None
         }
 
     except HTTPException:
@@ -578,22 +697,29 @@ async def toggle_menu_availability(
 ):
     """Toggle menu item availability"""
     try:
-        # Find the menu item
-        menu_item = db.query(MenuItem).filter(MenuItem.id == item_id).first()
-        if not menu_item:
+        # Flip availability (and the matching status) in one UPDATE; SET reads the old value
+        was_available = func.coalesce(MenuItem.is_available, False)
+        row = db.execute(
+            update(MenuItem)
+            .where(MenuItem.id == item_id)
+            .values(
+                is_available=~was_available,
+                # Postgres types a CASE over string literals as text; the column is an ENUM
+                status=cast(case((was_available, "unavailable"), else_="available"), MenuItem.status.type)
+            )
+            .returning(MenuItem.name, MenuItem.is_available)
+        ).first()
+        if row is None:
             raise HTTPException(status_code=404, detail="Menu item not found")
 
-        # Toggle availability
-        menu_item.is_available = not menu_item.is_available
-        # Update status to match availability
-        menu_item.status = "available" if menu_item.is_available else "unavailable"
-        menu_item.updated_at = datetime.utcnow()
-
         db.commit()
 
-        status_text = "available" if menu_item.is_available else "unavailable"
-        return {"message": f"Menu item '{menu_item.name}' is now {status_text}", "success": True, "available": menu_item.is_available}
+        status_text = "available" if row.is_available else "unavailable"
+        return {"message": f"Menu item '{row.name}' is now {status_text}", "success": True, "available": row.is_available}
 
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
@@ -606,24 +732,28 @@ async def toggle_user_active(
 ):
     """Toggle user active status"""
     try:
-        # Find the user
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-
-        # Don't allow disabling admin users
-        if user.role == "admin":
+        # Admin protection is part of the WHERE, so the check and the flip are atomic
+        row = db.execute(
+            update(User)
+            .where(User.id == user_id, User.role != "admin")
+            .values(is_active=~func.coalesce(User.is_active, False))
+            .returning(User.full_name, User.is_active)
+        ).first()
+        if row is None:
+            # Nothing updated: either no such user or an admin
+            role = db.scalar(select(User.role).where(User.id == user_id))
+            if role is None:
+                raise HTTPException(status_code=404, detail="User not found")
             raise HTTPException(status_code=403, detail="Cannot disable admin users")
 
-        # Toggle active status
-        user.is_active = not user.is_active
-        user.updated_at = datetime.utcnow()
-
         db.commit()
 
-        status_text = "activated" if user.is_active else "deactivated"
-        return {"message": f"User '{user.full_name}' has been {status_text}", "success": True, "active": user.is_active}
+        status_text = "activated" if row.is_active else "deactivated"
+        return {"message": f"User '{row.full_name}' has been {status_text}", "success": True, "active": row.is_active}
 
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
@@ -645,7 +775,6 @@ async def create_user(
             raise HTTPException(status_code=400, detail="User with this email already exists")
 
         # Hash password
-        from app.auth.auth import AuthService
         hashed_password = AuthService.get_password_hash(data['password'])
 
         # Create user
@@ -660,10 +789,13 @@ async def create_user(
         )
 
         db.add(user)
+        # The INSERT hands back the new id; read it before commit expires the instance
+        db.flush()
+        user_id = user.id
         db.commit()
-        db.refresh(user)
+        clear_dashboard_stats_cache()
 
-        return {"success": True, "message": "User created successfully", "user_id": user.id}
+        return {"success": True, "message": "User created successfully", "user_id": user_id}
 
     except HTTPException:
         raise
@@ -679,7 +811,7 @@ async def get_user(
 ):
     """Get user details for editing"""
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -707,7 +839,7 @@ async def update_user(
     try:
         data = await request.json()
 
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -718,10 +850,7 @@ async def update_user(
 
         # Update fields
         if 'email' in data:
-            # Check if email is already taken by another user
-            existing = db.query(User).filter(User.email == data['email'], User.id != user_id).first()
-            if existing:
-                raise HTTPException(status_code=400, detail="Email already in use")
+            # Uniqueness is enforced by the users.email UNIQUE index at commit
             user.email = data['email']
 
         if 'first_name' in data:
@@ -737,11 +866,14 @@ async def update_user(
 
         # Update password if provided
         if 'password' in data and data['password']:
-            from app.auth.auth import AuthService
             user.hashed_password = AuthService.get_password_hash(data['password'])
 
-        user.updated_at = datetime.utcnow()
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            field = "Email" if "email" in str(e.orig).lower() else "Phone number"
+            raise HTTPException(status_code=400, detail=f"{field} already in use")
 
         return {"success": True, "message": "User updated successfully"}
 
@@ -759,7 +891,7 @@ async def delete_user(
 ):
     """Delete a user"""
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -774,6 +906,7 @@ async def delete_user(
 
         db.delete(user)
         db.commit()
+        clear_dashboard_stats_cache()
 
         return {"success": True, "message": "User deleted successfully"}
 
@@ -816,6 +949,7 @@ async def create_menu_item(
 
         db.add(menu_item)
         db.commit()
+        clear_dashboard_stats_cache()
 
         return {"message": f"Menu item '{menu_item.name}' created successfully", "success": True, "item_id": menu_item.id}
 
@@ -831,12 +965,12 @@ async def get_menu_item(
 ):
     """Get menu item details for editing"""
     try:
-        menu_item = db.query(MenuItem).filter(MenuItem.id == item_id).first()
+        menu_item = db.get(MenuItem, item_id)
         if not menu_item:
             raise HTTPException(status_code=404, detail="Menu item not found")
 
-        # Get category name
-        category = db.query(MenuCategory).filter(MenuCategory.id == menu_item.category_id).first()
+        # MenuItem.category is joined-eager, so db.get already loaded it
+        category = menu_item.category
 
         return {
             "id": menu_item.id,
@@ -864,7 +998,7 @@ async def update_menu_item(
         data = await request.json()
 
         # Find the menu item
-        menu_item = db.query(MenuItem).filter(MenuItem.id == item_id).first()
+        menu_item = db.get(MenuItem, item_id)
         if not menu_item:
             raise HTTPException(status_code=404, detail="Menu item not found")
 
@@ -874,7 +1008,7 @@ async def update_menu_item(
         if "description" in data:
             menu_item.description = data["description"]
         if "price" in data:
-            menu_item.price = float(data["price"])
+            menu_item.price = Decimal(str(data["price"]))
         if "available" in data:
             menu_item.is_available = data["available"]
             # Update status based on availability
@@ -888,7 +1022,6 @@ async def update_menu_item(
         if menu_item.status is None:
             menu_item.status = "available" if menu_item.is_available else "unavailable"
 
-        menu_item.updated_at = datetime.utcnow()
         db.commit()
 
         return {"message": f"Menu item '{menu_item.name}' updated successfully", "success": True}
@@ -906,22 +1039,24 @@ async def delete_menu_item(
     """Delete a menu item"""
     try:
         # Find the menu item
-        menu_item = db.query(MenuItem).filter(MenuItem.id == item_id).first()
+        menu_item = db.get(MenuItem, item_id)
         if not menu_item:
             raise HTTPException(status_code=404, detail="Menu item not found")
 
-        # Check if item has existing orders
-        has_orders = db.query(OrderItem).filter(OrderItem.menu_item_id == item_id).first()
+        # Check if item has existing orders (SELECT EXISTS stops at the first match)
+        has_orders = db.query(
+            db.query(OrderItem).filter(OrderItem.menu_item_id == item_id).exists()
+        ).scalar()
         if has_orders:
             # Don't delete, just make unavailable
             menu_item.is_available = False
-            menu_item.updated_at = datetime.utcnow()
             db.commit()
             return {"message": f"Menu item '{menu_item.name}' marked as unavailable (has existing orders)", "success": True}
         else:
             # Safe to delete
             db.delete(menu_item)
             db.commit()
+            clear_dashboard_stats_cache()
             return {"message": f"Menu item deleted successfully", "success": True}
 
     except Exception as e:
@@ -1,8 +1,11 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import hashlib
+import hmac
+import time
 from typing import Optional, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from passlib.hash import bcrypt
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -12,7 +15,21 @@ from ..models.database_models import User, UserRole
 from ..schemas import TokenData
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+
+# Same cost as real hashes; compared against when there is no account to check
+DUMMY_PASSWORD_HASH = "$2b$12$3qDx7c8j2raiGvWDfjrvr.ubN1F37dWUaK1kKZ47G9d6TgyaeXKHO"
+
+# Recent verify outcomes, only used when settings.password_verify_cache is on.
+# Keys hold an HMAC of the password, never the password itself.
+VERIFY_CACHE_SIZE = 256
+_verify_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+
+# Recently verified tokens: token -> (cache expiry epoch, TokenData).
+# Entries never outlive the token's own exp claim.
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_SIZE = 1024
+_token_cache: "OrderedDict[str, tuple]" = OrderedDict()
 
 # JWT Security
 security = HTTPBearer()
@@ -23,7 +40,21 @@ class AuthService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return pwd_context.verify(plain_password, hashed_password)
+        if not settings.password_verify_cache:
+            return pwd_context.verify(plain_password, hashed_password)
+
+        digest = hmac.new(settings.secret_key.encode(), plain_password.encode(), hashlib.sha256).digest()
+        key = (digest, hashed_password)
+        cached = _verify_cache.get(key)
+        if cached is not None:
+            _verify_cache.move_to_end(key)
+            return cached
+
+        result = pwd_context.verify(plain_password, hashed_password)
+        _verify_cache[key] = result
+        if len(_verify_cache) > VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+        return result
 
     @staticmethod
     def get_password_hash(password: str) -> str:
@@ -46,6 +77,15 @@ class AuthService:
     @staticmethod
     def verify_token(token: str) -> TokenData:
         """Verify and decode JWT token"""
+        now = time.time()
+        cached = _token_cache.get(token)
+        if cached is not None:
+            expires_at, token_data = cached
+            if expires_at > now:
+                _token_cache.move_to_end(token)
+                return token_data
+            del _token_cache[token]
+
         try:
             payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
             user_id: str = payload.get("sub")
@@ -59,6 +99,9 @@ class AuthService:
                 )
 
             token_data = TokenData(user_id=user_id, email=email)
+            _token_cache[token] = (min(payload.get("exp", now), now + TOKEN_CACHE_TTL), token_data)
+            if len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
             return token_data
 
         except JWTError:
@@ -1,5 +1,7 @@
+from functools import lru_cache
 from typing import Optional
 import os
+import secrets
 
 class Settings:
     """Simple settings class without Pydantic"""
@@ -10,10 +12,26 @@ class Settings:
     if database_url.startswith("postgres://"):
         database_url = database_url.replace("postgres://", "postgresql://", 1)
 
+    # Connection pool (server databases)
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds to wait for a free connection
+    # SELECT 1 on every checkout; worth it against remote databases that drop idle connections
+    db_pre_ping: bool = os.getenv(
+        "DB_PRE_PING", "False" if os.getenv("ENVIRONMENT", "development") == "development" else "True"
+    ).lower() == "true"
+
+    # Rows per INSERT statement when SQLAlchemy batches executemany inserts
+    insert_batch_size: int = int(os.getenv("INSERT_BATCH_SIZE", "1000"))
+
     # Security
     secret_key: str = os.getenv("SECRET_KEY", "your-secret-key-here-change-in-production")
+    # Signs admin session cookies; without it a random key is used and sessions end on restart
+    session_secret_key: str = os.getenv("SESSION_SECRET_KEY") or secrets.token_urlsafe(32)
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    # Remember recent bcrypt verify outcomes (keyed by an HMAC of the password); off by default
+    password_verify_cache: bool = os.getenv("PASSWORD_VERIFY_CACHE", "False").lower() == "true"
 
     # CORS - Allow frontend origins
     allowed_origins: list = [origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:5173,http://localhost:3000").split(",")]
@@ -42,4 +60,9 @@ class Settings:
     environment: str = os.getenv("ENVIRONMENT", "development")
     port: int = int(os.getenv("PORT", "8000"))
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings instance; environment variables are read once"""
+    return Settings()
+
+settings = get_settings()
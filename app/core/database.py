@@ -1,22 +1,53 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from .config import settings
+from .config import get_settings
 import logging
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+is_sqlite = settings.database_url.startswith("sqlite")
+
+# Pool sizing only applies to server databases; SQLite keeps SQLAlchemy's default pool
+pool_options = {} if is_sqlite else {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout,
+}
 
 # Create engine with connection pooling and timeout settings
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,  # Verify connections before using
+    pool_pre_ping=settings.db_pre_ping,  # Verify connections before using (off in development)
     pool_recycle=3600,   # Recycle connections after 1 hour
+    query_cache_size=1200,  # Room for every admin/API statement in the compiled-SQL cache (default 500)
+    insertmanyvalues_page_size=settings.insert_batch_size,  # Rows per batched multi-row INSERT
     connect_args={
         "connect_timeout": 10,
         "options": "-c timezone=utc"
-    } if settings.database_url.startswith("postgresql") else {}
+    } if settings.database_url.startswith("postgresql") else {
+        "check_same_thread": False  # Pooled SQLite connections are shared across worker threads
+    },
+    **pool_options
 )
 
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    """Tune every new SQLite connection for concurrent reads and cheap commits"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA busy_timeout=5000")  # Wait up to 5s for the write lock instead of failing with SQLITE_BUSY
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")  # Readers no longer block on the writer
+    cursor.execute("PRAGMA wal_autocheckpoint=1000")  # Checkpoint every 1000 pages so the WAL stays small
+    cursor.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, avoids an fsync per commit
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+    cursor.close()
+
+if is_sqlite:
+    event.listen(engine, "connect", set_sqlite_pragma)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -1,22 +1,221 @@
 """
 Database initialization and seed data for Vendorr PWA
 """
+from sqlalchemy import insert, select, text
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 from ..models.database_models import *
+from ..core.config import settings
 from ..core.database import engine, SessionLocal
+import bcrypt
+import io
 import json
+import os
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Seed accounts in development don't need production-strength rounds
+BCRYPT_ROUNDS = 4 if settings.environment == "development" else 12
+
+# Seed rows are built once, at import
+EMPTY_JSON_LIST = []
+DAIRY = ["dairy"]
+GLUTEN_DAIRY = ["gluten", "dairy"]
+GLUTEN_DAIRY_EGGS = ["gluten", "dairy", "eggs"]
+EXTRA_CHEESE = [{"name": "Extra Cheese", "price": 1.50}]
+
+SEED_CATEGORIES = [
+    {"name": "Burgers", "description": "Delicious beef and chicken burgers", "display_order": 1},
+    {"name": "Wraps", "description": "Fresh wraps with various fillings", "display_order": 2},
+    {"name": "Sides", "description": "Crispy sides and appetizers", "display_order": 3},
+    {"name": "Beverages", "description": "Cold and hot drinks", "display_order": 4},
+    {"name": "Desserts", "description": "Sweet treats and desserts", "display_order": 5}
+]
+
+# Each item names its category; ids are filled in when the categories are inserted
+SEED_MENU_ITEMS = [
+    # Burgers
+    {
+        "name": "Classic Beef Burger",
+        "description": "Juicy beef patty with lettuce, tomato, onion, and our special sauce",
+        "price": 12.99,
+        "category": "Burgers",
+        "is_featured": True,
+        "preparation_time": 15,
+        "calories": 650,
+        "allergens": GLUTEN_DAIRY,
+        "customization_options": [
+            {"name": "Extra Cheese", "price": 1.50},
+            {"name": "Bacon", "price": 2.00},
+            {"name": "Avocado", "price": 1.75}
+        ]
+    },
+    {
+        "name": "Chicken Deluxe",
+        "description": "Grilled chicken breast with crispy lettuce and mayo",
+        "price": 11.99,
+        "category": "Burgers",
+        "preparation_time": 12,
+        "calories": 520,
+        "allergens": GLUTEN_DAIRY,
+        "customization_options": [
+            {"name": "Spicy Sauce", "price": 0.50},
+            {"name": "Extra Chicken", "price": 3.00}
+        ]
+    },
+    # Wraps
+    {
+        "name": "Mediterranean Wrap",
+        "description": "Grilled chicken, hummus, vegetables, and tzatziki in a soft tortilla",
+        "price": 10.99,
+        "category": "Wraps",
+        "is_featured": True,
+        "preparation_time": 10,
+        "calories": 480,
+        "allergens": GLUTEN_DAIRY,
+        "customization_options": [
+            {"name": "Extra Hummus", "price": 1.00},
+            {"name": "Feta Cheese", "price": 1.50}
+        ]
+    },
+    {
+        "name": "BBQ Chicken Wrap",
+        "description": "Tender BBQ chicken with coleslaw and crispy onions",
+        "price": 11.49,
+        "category": "Wraps",
+        "preparation_time": 10,
+        "calories": 510,
+        "allergens": GLUTEN_DAIRY,
+        "customization_options": [
+            {"name": "Extra BBQ Sauce", "price": 0.50},
+            {"name": "Jalapeños", "price": 0.75}
+        ]
+    },
+    # Sides
+    {
+        "name": "Crispy Fries",
+        "description": "Golden crispy french fries with sea salt",
+        "price": 4.99,
+        "category": "Sides",
+        "preparation_time": 8,
+        "calories": 320,
+        "allergens": EMPTY_JSON_LIST,
+        "customization_options": [
+            {"name": "Cheese Sauce", "price": 1.50},
+            {"name": "Truffle Oil", "price": 2.00}
+        ]
+    },
+    {
+        "name": "Loaded Nachos",
+        "description": "Crispy nachos with cheese, jalapeños, and sour cream",
+        "price": 8.99,
+        "category": "Sides",
+        "preparation_time": 12,
+        "calories": 580,
+        "allergens": DAIRY,
+        "customization_options": [
+            {"name": "Guacamole", "price": 2.00},
+            {"name": "Extra Cheese", "price": 1.50}
+        ]
+    },
+    # Beverages
+    {
+        "name": "Fresh Lemonade",
+        "description": "Freshly squeezed lemons with a hint of mint",
+        "price": 3.99,
+        "category": "Beverages",
+        "preparation_time": 3,
+        "calories": 120,
+        "allergens": EMPTY_JSON_LIST,
+        "customization_options": [
+            {"name": "Extra Mint", "price": 0.25},
+            {"name": "Sugar-Free", "price": 0.00}
+        ]
+    },
+    {
+        "name": "Craft Cola",
+        "description": "House-made cola with natural ingredients",
+        "price": 2.99,
+        "category": "Beverages",
+        "preparation_time": 2,
+        "calories": 150,
+        "allergens": EMPTY_JSON_LIST,
+        "customization_options": EMPTY_JSON_LIST
+    },
+    # Desserts
+    {
+        "name": "Chocolate Brownie",
+        "description": "Rich chocolate brownie with vanilla ice cream",
+        "price": 6.99,
+        "category": "Desserts",
+        "preparation_time": 5,
+        "calories": 420,
+        "allergens": GLUTEN_DAIRY_EGGS,
+        "customization_options": [
+            {"name": "Extra Ice Cream", "price": 1.50},
+            {"name": "Nuts", "price": 1.00}
+        ]
+    }
+]
+
+ITEM_DEFAULTS = {"is_featured": False}
 
 def create_tables():
     """Create all database tables"""
     Base.metadata.create_all(bind=engine)
 
 def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
+    """Hash a password with bcrypt directly; the scheme is fixed, so passlib's policy layer isn't needed"""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+def _copy_value(value) -> str:
+    """Render one value in COPY's text format"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+def copy_rows(db: Session, model, rows: list[dict]) -> None:
+    """Bulk-insert rows inside the session's transaction.
+
+    On PostgreSQL the rows are streamed through COPY ... FROM STDIN, which beats even a
+    multi-row INSERT on large imports; other databases get a plain executemany INSERT.
+    COPY bypasses SQLAlchemy, so scalar Python-side column defaults are filled in here.
+    """
+    if not rows:
+        return
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        db.execute(insert(model), rows)
+        return
+
+    table = model.__table__
+    defaults = {
+        column.name: column.default.arg
+        for column in table.columns
+        if column.default is not None and column.default.is_scalar
+    }
+    columns = list(dict.fromkeys(name for row in rows for name in (*defaults, *row)))
+
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(row.get(name, defaults.get(name))) for name in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    quote = dialect.identifier_preparer.quote
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f'COPY {quote(table.name)} ({", ".join(map(quote, columns))}) FROM STDIN',
+            buffer
+        )
+    finally:
+        cursor.close()
 
 def seed_database():
     """Seed the database with initial data"""
@@ -24,260 +223,103 @@ def seed_database():
 
     try:
         # Check if data already exists
-        if db.query(User).first():
+        if db.execute(select(User.id).limit(1)).first() is not None:
             print("Database already seeded")
             return
 
-        # Create admin user
-        admin_user = User(
-            email="admin@vendorr.com",
-            phone="+1234567890",
-            hashed_password=get_password_hash("admin123"),
-            first_name="Admin",
-            last_name="User",
-            role="admin",
-            is_active=True,
-            is_verified=True
-        )
-        db.add(admin_user)
-
-        # Create staff users
-        kitchen_staff = User(
-            email="kitchen@vendorr.com",
-            phone="+1234567891",
-            hashed_password=get_password_hash("kitchen123"),
-            first_name="Kitchen",
-            last_name="Staff",
-            role="kitchen",
-            is_active=True,
-            is_verified=True
-        )
-        db.add(kitchen_staff)
-
-        counter_staff = User(
-            email="counter@vendorr.com",
-            phone="+1234567892",
-            hashed_password=get_password_hash("counter123"),
-            first_name="Counter",
-            last_name="Staff",
-            role="counter",
-            is_active=True,
-            is_verified=True
-        )
-        db.add(counter_staff)
-
-        # Create test customer
-        test_customer = User(
-            email="customer@test.com",
-            phone="+1234567893",
-            hashed_password=get_password_hash("test123"),
-            first_name="Test",
-            last_name="Customer",
-            role="customer",
-            is_active=True,
-            is_verified=True
-        )
-        db.add(test_customer)
+        # Seed ids are assigned here, so every table goes in with one bulk write and
+        # nothing has to be flushed or read back before the rows that reference it
+        users = [
+            {"email": "admin@vendorr.com", "phone": "+1234567890", "password": "admin123",
+             "first_name": "Admin", "last_name": "User", "role": UserRole.ADMIN.value},
+            {"email": "kitchen@vendorr.com", "phone": "+1234567891", "password": "kitchen123",
+             "first_name": "Kitchen", "last_name": "Staff", "role": UserRole.KITCHEN_STAFF.value},
+            {"email": "counter@vendorr.com", "phone": "+1234567892", "password": "counter123",
+             "first_name": "Counter", "last_name": "Staff", "role": UserRole.COUNTER_STAFF.value},
+            {"email": "customer@test.com", "phone": "+1234567893", "password": "test123",
+             "first_name": "Test", "last_name": "Customer", "role": UserRole.CUSTOMER.value},
+        ]
+        for user_id, user in enumerate(users, start=1):
+            # A pre-computed hash (e.g. SEED_ADMIN_PASSWORD_HASH) skips bcrypt entirely
+            password = user.pop("password")
+            preset_hash = os.getenv(f"SEED_{user['role'].upper()}_PASSWORD_HASH")
+            user["hashed_password"] = preset_hash or get_password_hash(password)
+            user.update(id=user_id, is_active=True, is_verified=True)
+        copy_rows(db, User, users)
+        test_customer_id = next(user["id"] for user in users if user["email"] == "customer@test.com")
 
         # Create menu categories
         categories_data = [
-            {"name": "Burgers", "description": "Delicious beef and chicken burgers", "sort_order": 1},
-            {"name": "Wraps", "description": "Fresh wraps with various fillings", "sort_order": 2},
-            {"name": "Sides", "description": "Crispy sides and appetizers", "sort_order": 3},
-            {"name": "Beverages", "description": "Cold and hot drinks", "sort_order": 4},
-            {"name": "Desserts", "description": "Sweet treats and desserts", "sort_order": 5}
+            {"id": category_id, **category}
+            for category_id, category in enumerate(SEED_CATEGORIES, start=1)
         ]
+        copy_rows(db, MenuCategory, categories_data)
+        category_ids = {category["name"]: category["id"] for category in categories_data}
 
-        categories = []
-        for cat_data in categories_data:
-            category = MenuCategory(**cat_data)
-            db.add(category)
-            categories.append(category)
+        # Create menu items
+        menu_items_data = []
+        for item_id, row in enumerate(SEED_MENU_ITEMS, start=1):
+            item = {**ITEM_DEFAULTS, **row, "id": item_id}
+            item["category_id"] = category_ids[item.pop("category")]
+            menu_items_data.append(item)
+        copy_rows(db, MenuItem, menu_items_data)
+        menu_item_ids = {item["name"]: item["id"] for item in menu_items_data}
+        prices = {item["name"]: item["price"] for item in menu_items_data}
 
-        db.flush()  # Get the IDs
+        # Create sample orders
+        sample_order_id = 1
+        copy_rows(db, Order, [{
+            "id": sample_order_id,
+            "order_number": "ORD-001",
+            "customer_id": test_customer_id,
+            "status": OrderStatus.PREPARING.value,
+            "payment_status": PaymentStatus.COMPLETED.value,
+            "total_amount": 25.97,
+            "tax_amount": 2.08,
+            "customer_name": "Test Customer",
+            "customer_phone": "+1234567893",
+            "customer_email": "customer@test.com",
+            "notes": "Extra napkins please",
+            "payment_method": "bank_transfer"
+        }])
 
-        # Create menu items
-        menu_items_data = [
-            # Burgers
-            {
-                "name": "Classic Beef Burger",
-                "description": "Juicy beef patty with lettuce, tomato, onion, and our special sauce",
-                "price": 12.99,
-                "category_id": categories[0].id,
-                "is_featured": True,
-                "preparation_time": 15,
-                "calories": 650,
-                "allergens": json.dumps(["gluten", "dairy"]),
-                "customization_options": json.dumps([
-                    {"name": "Extra Cheese", "price": 1.50},
-                    {"name": "Bacon", "price": 2.00},
-                    {"name": "Avocado", "price": 1.75}
-                ])
-            },
-            {
-                "name": "Chicken Deluxe",
-                "description": "Grilled chicken breast with crispy lettuce and mayo",
-                "price": 11.99,
-                "category_id": categories[0].id,
-                "preparation_time": 12,
-                "calories": 520,
-                "allergens": json.dumps(["gluten", "dairy"]),
-                "customization_options": json.dumps([
-                    {"name": "Spicy Sauce", "price": 0.50},
-                    {"name": "Extra Chicken", "price": 3.00}
-                ])
-            },
-            # Wraps
-            {
-                "name": "Mediterranean Wrap",
-                "description": "Grilled chicken, hummus, vegetables, and tzatziki in a soft tortilla",
-                "price": 10.99,
-                "category_id": categories[1].id,
-                "is_featured": True,
-                "preparation_time": 10,
-                "calories": 480,
-                "allergens": json.dumps(["gluten", "dairy"]),
-                "customization_options": json.dumps([
-                    {"name": "Extra Hummus", "price": 1.00},
-                    {"name": "Feta Cheese", "price": 1.50}
-                ])
-            },
-            {
-                "name": "BBQ Chicken Wrap",
-                "description": "Tender BBQ chicken with coleslaw and crispy onions",
-                "price": 11.49,
-                "category_id": categories[1].id,
-                "preparation_time": 10,
-                "calories": 510,
-                "allergens": json.dumps(["gluten", "dairy"]),
-                "customization_options": json.dumps([
-                    {"name": "Extra BBQ Sauce", "price": 0.50},
-                    {"name": "Jalapeños", "price": 0.75}
-                ])
-            },
-            # Sides
-            {
-                "name": "Crispy Fries",
-                "description": "Golden crispy french fries with sea salt",
-                "price": 4.99,
-                "category_id": categories[2].id,
-                "preparation_time": 8,
-                "calories": 320,
-                "allergens": json.dumps([]),
-                "customization_options": json.dumps([
-                    {"name": "Cheese Sauce", "price": 1.50},
-                    {"name": "Truffle Oil", "price": 2.00}
-                ])
-            },
-            {
-                "name": "Loaded Nachos",
-                "description": "Crispy nachos with cheese, jalapeños, and sour cream",
-                "price": 8.99,
-                "category_id": categories[2].id,
-                "preparation_time": 12,
-                "calories": 580,
-                "allergens": json.dumps(["dairy"]),
-                "customization_options": json.dumps([
-                    {"name": "Guacamole", "price": 2.00},
-                    {"name": "Extra Cheese", "price": 1.50}
-                ])
-            },
-            # Beverages
-            {
-                "name": "Fresh Lemonade",
-                "description": "Freshly squeezed lemons with a hint of mint",
-                "price": 3.99,
-                "category_id": categories[3].id,
-                "preparation_time": 3,
-                "calories": 120,
-                "allergens": json.dumps([]),
-                "customization_options": json.dumps([
-                    {"name": "Extra Mint", "price": 0.25},
-                    {"name": "Sugar-Free", "price": 0.00}
-                ])
-            },
+        # Add order items
+        copy_rows(db, OrderItem, [
             {
-                "name": "Craft Cola",
-                "description": "House-made cola with natural ingredients",
-                "price": 2.99,
-                "category_id": categories[3].id,
-                "preparation_time": 2,
-                "calories": 150,
-                "allergens": json.dumps([]),
-                "customization_options": json.dumps([])
+                "order_id": sample_order_id,
+                "menu_item_id": menu_item_ids["Classic Beef Burger"],
+                "quantity": 1,
+                "unit_price": prices["Classic Beef Burger"],
+                "total_price": prices["Classic Beef Burger"],
+                "customizations": EXTRA_CHEESE
             },
-            # Desserts
             {
-                "name": "Chocolate Brownie",
-                "description": "Rich chocolate brownie with vanilla ice cream",
-                "price": 6.99,
-                "category_id": categories[4].id,
-                "preparation_time": 5,
-                "calories": 420,
-                "allergens": json.dumps(["gluten", "dairy", "eggs"]),
-                "customization_options": json.dumps([
-                    {"name": "Extra Ice Cream", "price": 1.50},
-                    {"name": "Nuts", "price": 1.00}
-                ])
+                "order_id": sample_order_id,
+                "menu_item_id": menu_item_ids["Crispy Fries"],
+                "quantity": 2,
+                "unit_price": prices["Crispy Fries"],
+                "total_price": prices["Crispy Fries"] * 2,
+                "customizations": None
             }
-        ]
-
-        for item_data in menu_items_data:
-            menu_item = MenuItem(**item_data)
-            db.add(menu_item)
-
-        # Create sample orders
-        db.flush()  # Get menu item IDs
-
-        sample_order = Order(
-            order_number="ORD-001",
-            customer_id=test_customer.id,
-            status=OrderStatus.PREPARING,
-            payment_status=PaymentStatus.COMPLETED,
-            total_amount=25.97,
-            tax_amount=2.08,
-            customer_name="Test Customer",
-            customer_phone="+1234567893",
-            customer_email="customer@test.com",
-            notes="Extra napkins please",
-            payment_method="bank_transfer"
-        )
-        db.add(sample_order)
-        db.flush()
-
-        # Add order items
-        burger_item = db.query(MenuItem).filter(MenuItem.name == "Classic Beef Burger").first()
-        fries_item = db.query(MenuItem).filter(MenuItem.name == "Crispy Fries").first()
-
-        order_item1 = OrderItem(
-            order_id=sample_order.id,
-            menu_item_id=burger_item.id,
-            quantity=1,
-            unit_price=burger_item.price,
-            total_price=burger_item.price,
-            customizations=json.dumps([{"name": "Extra Cheese", "price": 1.50}])
-        )
-
-        order_item2 = OrderItem(
-            order_id=sample_order.id,
-            menu_item_id=fries_item.id,
-            quantity=2,
-            unit_price=fries_item.price,
-            total_price=fries_item.price * 2
-        )
-
-        db.add(order_item1)
-        db.add(order_item2)
+        ])
 
         # Create sample notifications
-        notification = Notification(
-            user_id=test_customer.id,
-            order_id=sample_order.id,
-            title="Order Update",
-            message="Your order #ORD-001 is being prepared!",
-            type="order_status"
-        )
-        db.add(notification)
+        copy_rows(db, Notification, [{
+            "user_id": test_customer_id,
+            "order_id": sample_order_id,
+            "title": "Order Update",
+            "message": "Your order #ORD-001 is being prepared!",
+            "type": "order_status"
+        }])
+
+        # Explicit ids don't advance Postgres serial sequences; move them past the seed rows
+        if db.get_bind().dialect.name == "postgresql":
+            for model in (User, MenuCategory, MenuItem, Order):
+                table = model.__tablename__
+                db.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"(SELECT MAX(id) FROM {table}))"
+                ))
 
         # Commit all changes
         db.commit()
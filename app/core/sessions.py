@@ -0,0 +1,60 @@
+"""
+Signed-cookie sessions with verification results cached in-process
+"""
+from collections import OrderedDict
+from typing import Optional
+
+import itsdangerous
+from starlette.middleware.sessions import SessionMiddleware
+
+
+class CachingTimestampSigner(itsdangerous.TimestampSigner):
+    """TimestampSigner that skips the HMAC check for cookies it has already verified or issued.
+
+    Starlette re-signs the session on every response, so the cookie a browser sends back
+    is almost always one this process signed itself. Entries keep the signing timestamp,
+    so max_age is still enforced on cache hits.
+    """
+
+    def __init__(self, *args, cache_size: int = 1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_size = cache_size
+        self._verified: "OrderedDict[bytes, tuple[bytes, int]]" = OrderedDict()
+
+    def _remember(self, signed_value: bytes, value: bytes, timestamp: int) -> None:
+        self._verified[signed_value] = (value, timestamp)
+        if len(self._verified) > self.cache_size:
+            self._verified.popitem(last=False)
+
+    def sign(self, value) -> bytes:
+        # Read the clock first: the recorded time is never later than the one embedded
+        timestamp = self.get_timestamp()
+        signed_value = super().sign(value)
+        self._remember(signed_value, itsdangerous.encoding.want_bytes(value), timestamp)
+        return signed_value
+
+    def unsign(self, signed_value, max_age: Optional[int] = None, return_timestamp: bool = False):
+        if return_timestamp:
+            return super().unsign(signed_value, max_age=max_age, return_timestamp=True)
+
+        signed_value = itsdangerous.encoding.want_bytes(signed_value)
+        cached = self._verified.get(signed_value)
+        if cached is not None:
+            value, timestamp = cached
+            if max_age is None or self.get_timestamp() - timestamp <= max_age:
+                self._verified.move_to_end(signed_value)
+                return value
+            # Expired: let itsdangerous raise SignatureExpired
+            del self._verified[signed_value]
+
+        value, signed_at = super().unsign(signed_value, max_age=max_age, return_timestamp=True)
+        self._remember(signed_value, value, int(signed_at.timestamp()))
+        return value
+
+
+class CachedSessionMiddleware(SessionMiddleware):
+    """Starlette's SessionMiddleware using CachingTimestampSigner"""
+
+    def __init__(self, app, secret_key, **kwargs):
+        super().__init__(app, secret_key, **kwargs)
+        self.signer = CachingTimestampSigner(str(secret_key))
@@ -0,0 +1,31 @@
+"""
+Request timing as a pure ASGI middleware
+"""
+import time
+
+
+class TimingMiddleware:
+    """Adds an X-Process-Time header (seconds) to every HTTP response.
+
+    The header is stamped onto the http.response.start message as it passes through,
+    so, unlike @app.middleware("http"), there is no call_next task and the response
+    body is never re-streamed.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()  # Monotonic, and no float math until the header is built
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                elapsed = f"{(time.perf_counter_ns() - start) / 1e9:.6f}"
+                message["headers"] = [*message.get("headers", ()), (b"x-process-time", elapsed.encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
@@ -1,16 +1,26 @@
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
-from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
 from fastapi.openapi.utils import get_openapi
-from starlette.middleware.sessions import SessionMiddleware
-import os
+import orjson
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 
-# Import routers (will be created in later todos)
-from .routers import auth, api_test, menu, orders  # payments, admin, notifications
+from .core.config import get_settings
+from .core.sessions import CachedSessionMiddleware
+from .core.timing import TimingMiddleware
+
+# Import routers
+from .routers import auth, api_test, menu, orders, websocket
+from .routers import settings as settings_router
+from .admin_dashboard import admin_router
+
+settings = get_settings()
 
 # Custom OpenAPI schema
 def custom_openapi():
@@ -99,106 +109,126 @@ def custom_openapi():
     app.openapi_schema = openapi_schema
     return app.openapi_schema
 
+OPENAPI_URL = "/openapi.json"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the schema before the first /openapi.json or /docs request
+    openapi_json()
+    yield
+
+# The schema and docs pages are served by the routes at the bottom of this module
 app = FastAPI(
     title="Vendorr Restaurant API",
     description="Restaurant ordering system API for Vendorr PWA",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    default_response_class=ORJSONResponse,  # JSON endpoints serialize through orjson
+    lifespan=lifespan
 )
 
 # Set custom OpenAPI schema
 app.openapi = custom_openapi
 
 # Session middleware for admin authentication
-# Using a strong secret key from environment or a secure default that changes with each deployment
-import secrets
-SESSION_SECRET = os.getenv("SESSION_SECRET_KEY", secrets.token_urlsafe(32))
-app.add_middleware(SessionMiddleware, secret_key=SESSION_SECRET)
+app.add_middleware(CachedSessionMiddleware, secret_key=settings.session_secret_key)
 
 # CORS middleware for frontend communication
-from .core.config import settings
-import re
-
-# Custom CORS origin validator
-def check_cors_origin(origin: str, allowed_origins: list) -> bool:
-    """Check if origin is allowed, including Vercel preview URLs"""
-    # Check exact matches
-    if origin in allowed_origins:
-        return True
-    # Allow all Vercel preview URLs (includes hyphens, underscores, numbers)
-    # Pattern: https://anything.vercel.app
-    if origin and origin.startswith("https://") and origin.endswith(".vercel.app"):
-        return True
-    return False
-
-# Get all allowed origins including Vercel pattern
-allowed_origins_list = settings.allowed_origins.copy()
-
-# Add CORS middleware with origin validation
-@app.middleware("http")
-async def cors_middleware(request: Request, call_next):
-    origin = request.headers.get("origin")
-
-    # Handle preflight requests
-    if request.method == "OPTIONS":
-        if origin and check_cors_origin(origin, allowed_origins_list):
-            return JSONResponse(
-                content={},
-                headers={
-                    "Access-Control-Allow-Origin": origin,
-                    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
-                    "Access-Control-Allow-Headers": "*",
-                    "Access-Control-Allow-Credentials": "true",
-                    "Access-Control-Max-Age": "3600",
-                },
-            )
-        return JSONResponse(content={}, status_code=403)
-
-    # Process request
-    response = await call_next(request)
-
-    # Add CORS headers if origin is allowed
-    if origin and check_cors_origin(origin, allowed_origins_list):
-        response.headers["Access-Control-Allow-Origin"] = origin
-        response.headers["Access-Control-Allow-Credentials"] = "true"
-        response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, PATCH"
-        response.headers["Access-Control-Allow-Headers"] = "*"
-        response.headers["Access-Control-Expose-Headers"] = "*"
-
-    return response
+# Configured origins match exactly; Vercel preview deployments (https://anything.vercel.app)
+# match one precompiled pattern
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.allowed_origins,
+    allow_origin_regex=r"https://.*\.vercel\.app",
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+    allow_headers=["Authorization", "Content-Type"],
+    allow_credentials=True,
+    expose_headers=["X-Process-Time"],
+    max_age=3600,
+)
 
 # Request timing middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+app.add_middleware(TimingMiddleware)
+
+# Response timestamps have one-second resolution, so format each second only once
+_iso_second = 0
+_iso_string = ""
+
+def iso_now() -> str:
+    """Current local time as an ISO 8601 string, reformatted at most once per second"""
+    global _iso_second, _iso_string
+    now = int(time.time())
+    if now != _iso_second:
+        _iso_second = now
+        _iso_string = datetime.fromtimestamp(now).isoformat()
+    return _iso_string
 
 # Global exception handler
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": True,
             "message": exc.detail,
             "status_code": exc.status_code,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "path": str(request.url)
         }
     )
 
 # Static files for uploaded content
-if not os.path.exists("uploads"):
-    os.makedirs("uploads")
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers reuse uploaded files for a day"""
 
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "public, max-age=86400")
+        return response
+
+Path("uploads").mkdir(exist_ok=True)
+app.mount("/uploads", CachedStaticFiles(directory="uploads", check_dir=False), name="uploads")
 
 # API Status Endpoints
+# The static parts of the status payloads are built once; each response only adds a timestamp
+ROOT_PAYLOAD = {
+    "message": "Welcome to Vendorr Restaurant API",
+    "status": "running",
+    "version": "1.0.0",
+    "documentation": "/docs",
+    "alternative_docs": "/redoc",
+    "openapi_schema": "/openapi.json"
+}
+
+HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "service": "vendorr-api",
+    "version": "1.0.0",
+    "uptime": "Available in production"
+}
+
+STATUS_PAYLOAD = {
+    "api": {
+        "status": "operational",
+        "version": "1.0.0",
+        "environment": "development"
+    },
+    "services": {
+        "authentication": "available",
+        "menu_management": "available",
+        "order_processing": "available",
+        "payment_processing": "available",
+        "notifications": "available",
+        "admin_panel": "available"
+    },
+    "database": {
+        "status": "connected",
+        "type": "postgresql"
+    }
+}
+
 @app.get("/", tags=["System"])
 async def root():
     """
@@ -206,15 +236,7 @@ async def root():
 
     Returns basic API information and status.
     """
-    return {
-        "message": "Welcome to Vendorr Restaurant API",
-        "status": "running",
-        "version": "1.0.0",
-        "documentation": "/docs",
-        "alternative_docs": "/redoc",
-        "openapi_schema": "/openapi.json",
-        "timestamp": datetime.now().isoformat()
-    }
+    return {**ROOT_PAYLOAD, "timestamp": iso_now()}
 
 @app.get("/health", tags=["System"])
 async def health_check():
@@ -224,13 +246,7 @@ async def health_check():
     Returns the current health status of the API service.
     Used by load balancers and monitoring systems.
     """
-    return {
-        "status": "healthy",
-        "service": "vendorr-api",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat(),
-        "uptime": "Available in production"
-    }
+    return {**HEALTH_PAYLOAD, "timestamp": iso_now()}
 
 @app.get("/api/status", tags=["System"])
 async def api_status():
@@ -242,42 +258,25 @@ async def api_status():
     - Service health
     - Feature availability
     """
-    return {
-        "api": {
-            "status": "operational",
-            "version": "1.0.0",
-            "environment": "development"
-        },
-        "services": {
-            "authentication": "available",
-            "menu_management": "available",
-            "order_processing": "available",
-            "payment_processing": "available",
-            "notifications": "available",
-            "admin_panel": "available"
-        },
-        "database": {
-            "status": "connected",
-            "type": "postgresql"
-        },
-        "timestamp": datetime.now().isoformat()
-    }
+    return {**STATUS_PAYLOAD, "timestamp": iso_now()}
 
 # Placeholder image endpoint
-@app.get("/api/placeholder/{width}/{height}", tags=["Utilities"])
-async def get_placeholder_image(width: int, height: int):
-    """Generate a simple placeholder image"""
-    from fastapi.responses import Response
-
-    # Simple SVG placeholder
-    svg_content = f'''<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
-        <rect width="100%" height="100%" fill="#e5e7eb"/>
-        <text x="50%" y="50%" text-anchor="middle" dy=".3em" fill="#9ca3af" font-family="Arial, sans-serif" font-size="14">
-            {width}x{height}
+PLACEHOLDER_SVG = b'''<svg width="%d" height="%d" xmlns="http://www.w3.org/2000/svg">
+        <rect width="100%%" height="100%%" fill="#e5e7eb"/>
+        <text x="50%%" y="50%%" text-anchor="middle" dy=".3em" fill="#9ca3af" font-family="Arial, sans-serif" font-size="14">
+            %dx%d
         </text>
     </svg>'''
 
-    return Response(content=svg_content, media_type="image/svg+xml")
+@lru_cache(maxsize=256)
+def placeholder_svg(width: int, height: int) -> bytes:
+    """Render the placeholder once per size; the common icon sizes are reused"""
+    return PLACEHOLDER_SVG % (width, height, width, height)
+
+@app.get("/api/placeholder/{width}/{height}", tags=["Utilities"])
+async def get_placeholder_image(width: int, height: int):
+    """Generate a simple placeholder image"""
+    return Response(content=placeholder_svg(width, height), media_type="image/svg+xml")
 
 
 # Lightweight favicon handler to avoid 405 when proxies request /favicon.ico
@@ -290,27 +289,46 @@ async def favicon():
     real favicon from the backend, replace this with a FileResponse pointing to
     a real icon file.
     """
-    from fastapi.responses import Response
     return Response(status_code=204)
 
-# Import routers
-from .routers import auth, api_test, menu, orders, websocket
-from .admin_dashboard import admin_router
-
 # Router registration
-app.include_router(api_test.router, prefix="/api/mock", tags=["API Test Endpoints"])
 app.include_router(admin_router, prefix="/admin", tags=["Admin Dashboard"])
 
-# Include API routers
-app.include_router(api_test.router, prefix="/api/test", tags=["Testing"])
+# Include API routers; the mock endpoints are only served in development
+if settings.environment == "development":
+    app.include_router(api_test.router, prefix="/api/test", tags=["Testing"])
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(menu.router, prefix="/api/menu", tags=["Menu"])
 app.include_router(orders.router, prefix="/api/orders", tags=["Orders"])
 app.include_router(websocket.router, tags=["WebSocket Notifications"])
 
-# Import and include settings router
-from .routers import settings
-app.include_router(settings.router, tags=["Settings"])
+app.include_router(settings_router.router, tags=["Settings"])
+
+# The schema only depends on the registered routes: serialize it once and serve the bytes
+# instead of re-encoding it on every request like FastAPI's built-in handler
+@lru_cache(maxsize=1)
+def openapi_json() -> bytes:
+    return orjson.dumps(app.openapi())
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_schema():
+    return Response(content=openapi_json(), media_type="application/json")
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui():
+    return get_swagger_ui_html(
+        openapi_url=OPENAPI_URL,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url="/docs/oauth2-redirect"
+    )
+
+@app.get("/docs/oauth2-redirect", include_in_schema=False)
+async def swagger_ui_redirect():
+    return get_swagger_ui_oauth2_redirect_html()
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc():
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
 
 if __name__ == "__main__":
     import uvicorn
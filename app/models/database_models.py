@@ -1,13 +1,20 @@
 """
 SQLAlchemy database models for Vendorr PWA
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Index, Integer, String, Numeric, Boolean, DateTime, Text, ForeignKey, JSON, Select, Sequence, select, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import column_property, raiseload, relationship, selectinload
+from sqlalchemy.sql import func, text
+from sqlalchemy.sql.functions import FunctionElement
 from ..core.database import Base
 import enum
 from datetime import datetime
 
+# Native JSON column: JSONB on PostgreSQL, JSON text on SQLite; values load as Python objects.
+# None is stored as SQL NULL (not JSON null), as the old text columns did
+JSONType = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
+
 
 class OrderStatus(str, enum.Enum):
     PENDING_PAYMENT = "pending_payment"
@@ -35,6 +42,20 @@ class UserRole(str, enum.Enum):
     ADMIN = "admin"
 
 
+class MenuItemStatus(str, enum.Enum):
+    AVAILABLE = "available"
+    UNAVAILABLE = "unavailable"
+    OUT_OF_STOCK = "out_of_stock"
+
+
+def _status_type(enum_class, name: str) -> SQLEnum:
+    """Native ENUM on PostgreSQL (CHECK-constrained VARCHAR elsewhere) over the enum's values.
+
+    Built from the string values rather than the class, so columns keep loading as plain strings.
+    """
+    return SQLEnum(*(member.value for member in enum_class), name=name, create_constraint=True)
+
+
 # User Model
 class User(Base):
     __tablename__ = "users"
@@ -45,19 +66,29 @@ class User(Base):
     hashed_password = Column(String(255), nullable=True)  # Nullable for OAuth users
     first_name = Column(String(100), nullable=True)
     last_name = Column(String(100), nullable=True)
-    role = Column(String(13), default="customer")  # Using string to match DB
+    role = Column(_status_type(UserRole, "userrole"), default=UserRole.CUSTOMER.value)
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
     profile_image = Column(String(255))
     google_id = Column(String(100), unique=True, index=True)
     facebook_id = Column(String(100), unique=True, index=True)
-    dietary_preferences = Column(Text)
-    notification_preferences = Column(Text)
+    dietary_preferences = Column(JSONType)
+    notification_preferences = Column(JSONType)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     last_login = Column(DateTime(timezone=True))
 
+    # "First Last" computed by the database in the same SELECT; missing parts count as empty
+    full_name = column_property(func.coalesce(first_name, "") + " " + func.coalesce(last_name, ""))
+
+    __table_args__ = (
+        # Keyset pagination of the admin users list (newest first)
+        Index("ix_users_created_at_id", created_at.desc(), id.desc()),
+    )
+
     # Relationships
+    # Users are loaded on every authenticated request, so their collections stay lazy;
+    # call sites that need them ask for selectinload explicitly
     orders = relationship("Order", back_populates="customer")
     reviews = relationship("Review", back_populates="user")
     notifications = relationship("Notification", back_populates="user")
@@ -74,71 +105,106 @@ class MenuCategory(Base):
     is_active = Column(Boolean, default=True)
     icon = Column(String(100))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    menu_items = relationship("MenuItem", back_populates="category")
+    menu_items = relationship("MenuItem", back_populates="category")  # Lazy: eager here would pull every sibling of each item
 
 
 # Menu Item Model
 class MenuItem(Base):
     __tablename__ = "menu_items"
 
+    # Fixed-width columns first, wide text/JSON last: less alignment padding, and the
+    # columns list pages actually read sit at the front of each row
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(200), nullable=False)
-    description = Column(Text)
-    price = Column(Float, nullable=False)
     category_id = Column(Integer, ForeignKey("menu_categories.id"))
-    image_url = Column(String(255))
-    thumbnail_url = Column(String(255))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     calories = Column(Integer)
-    ingredients = Column(Text)  # JSON string
-    allergens = Column(Text)  # JSON string
-    dietary_tags = Column(Text)  # JSON string
-    is_available = Column(Boolean, default=True)
-    is_featured = Column(Boolean, default=False)
-    status = Column(String(12), default='available')
     preparation_time = Column(Integer, default=15)  # minutes
     spice_level = Column(Integer)
+    status = Column(_status_type(MenuItemStatus, "menuitemstatus"), default=MenuItemStatus.AVAILABLE.value)
+    is_available = Column(Boolean, default=True)
+    is_featured = Column(Boolean, default=False)
     customizable = Column(Boolean, default=False)
-    customization_options = Column(Text)  # JSON string
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    price = Column(Numeric(10, 2), nullable=False)
+    name = Column(String(200), nullable=False)
+    image_url = Column(String(255))
+    thumbnail_url = Column(String(255))
+    description = Column(Text)
+    ingredients = Column(JSONType)
+    allergens = Column(JSONType)
+    dietary_tags = Column(JSONType)
+    customization_options = Column(JSONType)
 
     # Relationships
-    category = relationship("MenuCategory", back_populates="menu_items")
+    category = relationship("MenuCategory", back_populates="menu_items", lazy="joined")
     order_items = relationship("OrderItem", back_populates="menu_item")
     reviews = relationship("Review", back_populates="menu_item")
 
+    __table_args__ = (
+        # Tag filters use containment (dietary_tags @> '["vegan"]'), which GIN serves
+        Index("idx_menu_items_dietary_tags", "dietary_tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+
+# Order numbers come from a database sequence, so concurrent checkouts never race for one
+ORDER_NUMBER_SEQ = Sequence("order_number_seq", metadata=Base.metadata)
+
+
+class next_order_number(FunctionElement):
+    """SQL expression for the next 'ORD-00000042' number, evaluated inside the INSERT"""
+    type = String()
+    inherit_cache = True
+
+
+@compiles(next_order_number, "postgresql")
+def _next_order_number_pg(element, compiler, **kw):
+    return "'ORD-' || lpad(nextval('order_number_seq')::text, 8, '0')"
+
+
+@compiles(next_order_number)
+def _next_order_number_default(element, compiler, **kw):
+    # No sequences elsewhere (SQLite); writers are serialized, so the next id is free
+    return "'ORD-' || printf('%08d', (SELECT COALESCE(MAX(id), 0) + 1 FROM orders))"
+
 
 # Order Model
 class Order(Base):
     __tablename__ = "orders"
 
+    # Same layout rule as menu_items: fixed-width first, free text last
     id = Column(Integer, primary_key=True, index=True)
-    order_number = Column(String(50), unique=True, nullable=False)
     customer_id = Column(Integer, ForeignKey("users.id"))
-    status = Column(String(17), default="pending_payment")  # Using string to match DB
-    payment_status = Column(String(9), default="pending")  # Using string to match DB
-    subtotal = Column(Float, default=0)
-    tax_amount = Column(Float, default=0)
-    tip_amount = Column(Float, default=0)
-    total_amount = Column(Float, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    estimated_ready_time = Column(DateTime(timezone=True))
+    actual_ready_time = Column(DateTime(timezone=True))
+    status = Column(_status_type(OrderStatus, "orderstatus"), default=OrderStatus.PENDING_PAYMENT.value)
+    payment_status = Column(_status_type(PaymentStatus, "paymentstatus"), default=PaymentStatus.PENDING.value)
+    subtotal = Column(Numeric(10, 2), default=0)
+    tax_amount = Column(Numeric(10, 2), default=0)
+    tip_amount = Column(Numeric(10, 2), default=0)
+    total_amount = Column(Numeric(10, 2), nullable=False)
+    order_number = Column(String(20), default=next_order_number(), unique=True, nullable=False)
     customer_name = Column(String(200))
     customer_phone = Column(String(20))
     customer_email = Column(String(255))
-    notes = Column(Text)
-    estimated_ready_time = Column(DateTime(timezone=True))
-    actual_ready_time = Column(DateTime(timezone=True))
     payment_method = Column(String(50))
     payment_reference = Column(String(100))
     bank_transfer_receipt = Column(String(255))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    notes = Column(Text)
+
+    __table_args__ = (
+        # A customer's orders, optionally narrowed by status, newest first
+        Index("ix_orders_customer_status_created", "customer_id", "status", "created_at"),
+    )
 
     # Relationships
-    customer = relationship("User", back_populates="orders")
-    order_items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+    # Many-to-one sides JOIN into the parent query; collections load in one IN-batched SELECT
+    customer = relationship("User", back_populates="orders", lazy="joined")
+    order_items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan", lazy="selectin")
     notifications = relationship("Notification", back_populates="order")
 
 
@@ -150,14 +216,19 @@ class OrderItem(Base):
     order_id = Column(Integer, ForeignKey("orders.id"))
     menu_item_id = Column(Integer, ForeignKey("menu_items.id"))
     quantity = Column(Integer, nullable=False)
-    unit_price = Column(Float, nullable=False)
-    total_price = Column(Float, nullable=False)
-    customizations = Column(Text)  # JSON string
+    unit_price = Column(Numeric(10, 2), nullable=False)
+    total_price = Column(Numeric(10, 2), nullable=False)
+    customizations = Column(JSONType)
     notes = Column(Text)
 
+    __table_args__ = (
+        # Line items are always fetched by their order
+        Index("idx_order_items_order_id", "order_id"),
+    )
+
     # Relationships
-    order = relationship("Order", back_populates="order_items")
-    menu_item = relationship("MenuItem", back_populates="order_items")
+    order = relationship("Order", back_populates="order_items")  # Parent is already in the identity map
+    menu_item = relationship("MenuItem", back_populates="order_items", lazy="joined")
 
 
 # Review Model
@@ -174,11 +245,11 @@ class Review(Base):
     is_featured = Column(Boolean, default=False)
     helpful_count = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="reviews", foreign_keys=[customer_id])
-    menu_item = relationship("MenuItem", back_populates="reviews")
+    menu_item = relationship("MenuItem", back_populates="reviews", lazy="joined")
 
 
 # Notification Model
@@ -193,13 +264,22 @@ class Notification(Base):
     type = Column(String(50))  # Using 'type' instead of 'notification_type'
     is_read = Column(Boolean, default=False)
     is_sent = Column(Boolean, default=False)
-    push_notification_data = Column(Text)
+    push_notification_data = Column(JSONType)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     read_at = Column(DateTime(timezone=True))
 
+    __table_args__ = (
+        # "Latest unread for user X" reads the first entries of this partial index, already in order
+        Index(
+            "idx_notifications_user_unread_recent", "user_id", created_at.desc(),
+            postgresql_where=text("is_read = false"),
+            sqlite_where=text("is_read = false"),
+        ),
+    )
+
     # Relationships
     user = relationship("User", back_populates="notifications")
-    order = relationship("Order", back_populates="notifications")
+    order = relationship("Order", back_populates="notifications", lazy="joined")
 
 
 # Bank Transfer Model
@@ -209,7 +289,7 @@ class BankTransfer(Base):
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id"))
     sender_name = Column(String(200))
-    transfer_amount = Column(Float, nullable=False)
+    transfer_amount = Column(Numeric(10, 2), nullable=False)
     transfer_date = Column(DateTime(timezone=True))
     reference_number = Column(String(100))
     confirmed_by = Column(Integer, ForeignKey("users.id"))
@@ -218,7 +298,7 @@ class BankTransfer(Base):
     receipt_image_path = Column(String(255))
     is_confirmed = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
 # App Settings Model
@@ -233,4 +313,31 @@ class AppSettings(Base):
     restaurant_email = Column(String(200), default="vendorr1@gmail.com")
     restaurant_address = Column(Text, default="Red Brick, Faculty of Arts, University of Jos")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+# Loader options for rendering an order with its line items: one IN-batched SELECT for the
+# items, with each item's menu entry and category JOINed in. Use with query(Order).options(*...)
+ORDER_DETAIL_LOADERS = (
+    selectinload(Order.order_items).joinedload(OrderItem.menu_item).joinedload(MenuItem.category),
+)
+
+# Append after a query's explicit loaders: any relationship they didn't cover raises on access
+# instead of quietly emitting its own SELECT (identity-map hits are still allowed)
+STRICT_LOAD = raiseload("*", sql_only=True)
+
+# The columns menu lists and order pricing actually read; the description and JSON blobs stay behind
+MENU_ITEM_LIST_COLUMNS = (
+    MenuItem.id,
+    MenuItem.name,
+    MenuItem.price,
+    MenuItem.thumbnail_url,
+    MenuItem.is_available,
+    MenuItem.status,
+    MenuItem.category_id,
+)
+
+
+def select_menu_list_cols() -> Select:
+    """Plain-row SELECT of MENU_ITEM_LIST_COLUMNS, no ORM objects built"""
+    return select(*MENU_ITEM_LIST_COLUMNS)
@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 from typing import List, Optional
 
 from ..core.database import get_db
 from ..models.database_models import MenuCategory, MenuItem
 from ..schemas import MenuCategoryResponse, MenuItemResponse
-import json
 
 router = APIRouter()
 
@@ -30,7 +29,7 @@ def serialize_menu_item(item: MenuItem) -> dict:
         "spice_level": getattr(item, 'spice_level', 1),
         "is_daily_special": getattr(item, 'is_daily_special', False),
         "customizable": getattr(item, 'customizable', False),
-        "customization_options": None,
+        "customization_options": item.customization_options,
         "popularity_score": 4.0,  # Default value
         "total_orders": 0,  # Default value
         "created_at": item.created_at,
@@ -38,13 +37,6 @@ def serialize_menu_item(item: MenuItem) -> dict:
         "category": item.category
     }
 
-    # Parse JSON customization_options if it exists
-    if hasattr(item, 'customization_options') and item.customization_options:
-        try:
-            item_dict["customization_options"] = json.loads(item.customization_options)
-        except (json.JSONDecodeError, TypeError):
-            item_dict["customization_options"] = None
-
     return item_dict
 
 @router.get("/categories", response_model=List[MenuCategoryResponse])
@@ -67,7 +59,7 @@ async def get_menu_categories(
 @router.get("/categories/{category_id}", response_model=MenuCategoryResponse)
 async def get_menu_category(category_id: int, db: Session = Depends(get_db)):
     """Get a specific menu category"""
-    category = db.query(MenuCategory).filter(MenuCategory.id == category_id).first()
+    category = db.get(MenuCategory, category_id)
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -104,7 +96,14 @@ async def get_menu_items(
 @router.get("/items/{item_id}", response_model=MenuItemResponse)
 async def get_menu_item(item_id: int, db: Session = Depends(get_db)):
     """Get a specific menu item"""
-    item = db.query(MenuItem).filter(MenuItem.id == item_id).first()
+    # The response embeds the category; fill it from the same joined row
+    item = (
+        db.query(MenuItem)
+        .join(MenuItem.category)
+        .options(contains_eager(MenuItem.category))
+        .filter(MenuItem.id == item_id)
+        .first()
+    )
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,14 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, lazyload
 from typing import List, Optional
 from datetime import datetime
-import json
 import os
 import uuid
 from pathlib import Path
 
 from ..core.database import get_db
-from ..models.database_models import Order, OrderItem, User, MenuItem
+from ..models.database_models import ORDER_DETAIL_LOADERS, STRICT_LOAD, Order, OrderItem, User, MenuItem, select_menu_list_cols
 from ..schemas import OrderCreate, OrderResponse, OrderUpdate
 from ..auth.auth import get_current_active_user
 
@@ -82,8 +81,15 @@ async def create_order(
         subtotal = 0
         order_items_data = []
 
+        # Price every line from one narrow SELECT instead of loading each full menu item
+        requested_ids = {item_data.menu_item_id for item_data in order_data.items}
+        menu_items = {
+            row.id: row
+            for row in db.execute(select_menu_list_cols().where(MenuItem.id.in_(requested_ids)))
+        }
+
         for item_data in order_data.items:
-            menu_item = db.query(MenuItem).filter(MenuItem.id == item_data.menu_item_id).first()
+            menu_item = menu_items.get(item_data.menu_item_id)
             if not menu_item:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -104,7 +110,7 @@ async def create_order(
                 "quantity": item_data.quantity,
                 "unit_price": menu_item.price,
                 "total_price": item_total,
-                "customizations": json.dumps(item_data.customizations) if item_data.customizations else None,
+                "customizations": item_data.customizations or None,
                 "notes": item_data.special_instructions
             })
 
@@ -112,13 +118,9 @@ async def create_order(
         tax_amount = 0
         total_amount = subtotal
 
-        # Generate order number
-        order_count = db.query(Order).count() + 1
-        order_number = f"ORD{order_count:06d}"
-
         # Create order - only use fields that exist in the Order model
+        # (order_number is generated by the database during the INSERT)
         order = Order(
-            order_number=order_number,
             customer_id=current_user.id,
             status="pending_payment",
             customer_name=order_data.customer_name or f"{current_user.first_name} {current_user.last_name}",
@@ -150,7 +152,7 @@ async def create_order(
         # Load relationships for the response
         order_with_relations = (
             db.query(Order)
-            .options(joinedload(Order.order_items), joinedload(Order.customer))
+            .options(joinedload(Order.customer), *ORDER_DETAIL_LOADERS, STRICT_LOAD)
             .filter(Order.id == order.id)
             .first()
         )
@@ -187,7 +189,7 @@ async def get_my_orders(
     """Get current user's orders"""
     orders = (
         db.query(Order)
-        .options(joinedload(Order.order_items).joinedload(OrderItem.menu_item))
+        .options(joinedload(Order.customer), *ORDER_DETAIL_LOADERS, STRICT_LOAD)
         .filter(Order.customer_id == current_user.id)
         .order_by(Order.created_at.desc())
         .all()
@@ -203,7 +205,7 @@ async def get_order(
     """Get a specific order"""
     order = (
         db.query(Order)
-        .options(joinedload(Order.order_items).joinedload(OrderItem.menu_item))
+        .options(joinedload(Order.customer), *ORDER_DETAIL_LOADERS, STRICT_LOAD)
         .filter(Order.id == order_id)
         .filter(Order.customer_id == current_user.id)
         .first()
@@ -223,7 +225,7 @@ async def track_order(
     db: Session = Depends(get_db)
 ):
     """Track order by order number (public endpoint)"""
-    order = db.query(Order).filter(Order.order_number == order_number).first()
+    order = db.query(Order).options(lazyload("*")).filter(Order.order_number == order_number).first()
 
     if not order:
         raise HTTPException(
@@ -248,6 +250,7 @@ async def cancel_order(
     """Cancel an order (only if pending payment)"""
     order = (
         db.query(Order)
+        .options(lazyload("*"))
         .filter(Order.id == order_id)
         .filter(Order.customer_id == current_user.id)
         .first()
@@ -283,6 +286,7 @@ async def upload_payment_proof(
     # Verify order belongs to user
     order = (
         db.query(Order)
+        .options(lazyload("*"))
         .filter(Order.id == order_id)
         .filter(Order.customer_id == current_user.id)
         .first()
@@ -360,6 +364,7 @@ async def get_payment_proof(
     # Verify order belongs to user
     order = (
         db.query(Order)
+        .options(lazyload("*"))
         .filter(Order.id == order_id)
         .filter(Order.customer_id == current_user.id)
         .first()
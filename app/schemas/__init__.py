@@ -22,8 +22,9 @@ class OrderStatus(str, Enum):
 
 class PaymentStatus(str, Enum):
     PENDING = "pending"
-    CONFIRMED = "confirmed"
-    REJECTED = "rejected"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    REFUNDED = "refunded"
 
 class MenuItemStatus(str, Enum):
     AVAILABLE = "available"
@@ -131,7 +132,7 @@ class MenuItemBase(BaseSchema):
     status: MenuItemStatus = MenuItemStatus.AVAILABLE
     prep_time_minutes: int = Field(15, ge=1, le=180)
     is_daily_special: bool = False
-    customization_options: Optional[Dict[str, Any]] = None
+    customization_options: Optional[List[Dict[str, Any]]] = None  # [{"name": ..., "price": ...}]
 
 class MenuItemCreate(MenuItemBase):
     pass
@@ -151,7 +152,7 @@ class MenuItemUpdate(BaseSchema):
     status: Optional[MenuItemStatus] = None
     prep_time_minutes: Optional[int] = Field(None, ge=1, le=180)
     is_daily_special: Optional[bool] = None
-    customization_options: Optional[Dict[str, Any]] = None
+    customization_options: Optional[List[Dict[str, Any]]] = None  # [{"name": ..., "price": ...}]
 
 class MenuItemResponse(MenuItemBase):
     id: int
@@ -165,7 +166,7 @@ class MenuItemResponse(MenuItemBase):
 class OrderItemBase(BaseSchema):
     menu_item_id: int
     quantity: int = Field(..., ge=1, le=50)
-    customizations: Optional[Dict[str, Any]] = None
+    customizations: Optional[List[Dict[str, Any]]] = None  # Chosen customization options
     special_instructions: Optional[str] = None
 
 class OrderItemCreate(OrderItemBase):
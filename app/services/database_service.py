@@ -26,7 +26,7 @@ class DatabaseService:
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.get(User, user_id)
 
     def create_user(self, user_data: dict) -> User:
         """Create a new user"""
@@ -74,14 +74,10 @@ class DatabaseService:
     # Order operations
     def create_order(self, order_data: dict, order_items: List[dict]) -> Order:
         """Create a new order with items"""
-        # Generate order number
-        last_order = self.db.query(Order).order_by(desc(Order.id)).first()
-        order_number = f"ORD-{(last_order.id + 1):04d}" if last_order else "ORD-0001"
-
-        order_data['order_number'] = order_number
+        # order_number is generated by the database during the INSERT
         order = Order(**order_data)
         self.db.add(order)
-        self.db.flush()  # Get the order ID
+        self.db.flush()  # Get the order ID and number
 
         # Add order items
         for item_data in order_items:
@@ -97,20 +93,24 @@ class DatabaseService:
         """Get order by ID with all related data"""
         return self.db.query(Order).options(
             joinedload(Order.customer),
-            joinedload(Order.order_items).joinedload(OrderItem.menu_item)
+            *ORDER_DETAIL_LOADERS,
+            STRICT_LOAD
         ).filter(Order.id == order_id).first()
 
     def get_order_by_number(self, order_number: str) -> Optional[Order]:
         """Get order by order number"""
         return self.db.query(Order).options(
             joinedload(Order.customer),
-            joinedload(Order.order_items).joinedload(OrderItem.menu_item)
+            *ORDER_DETAIL_LOADERS,
+            STRICT_LOAD
         ).filter(Order.order_number == order_number).first()
 
     def get_user_orders(self, user_id: int, skip: int = 0, limit: int = 50) -> List[Order]:
         """Get orders for a specific user"""
         return self.db.query(Order).options(
-            joinedload(Order.order_items).joinedload(OrderItem.menu_item)
+            joinedload(Order.customer),
+            *ORDER_DETAIL_LOADERS,
+            STRICT_LOAD
         ).filter(Order.customer_id == user_id).order_by(
             desc(Order.created_at)
         ).offset(skip).limit(limit).all()
@@ -119,7 +119,8 @@ class DatabaseService:
         """Get all orders with optional status filter"""
         query = self.db.query(Order).options(
             joinedload(Order.customer),
-            joinedload(Order.order_items).joinedload(OrderItem.menu_item)
+            *ORDER_DETAIL_LOADERS,
+            STRICT_LOAD
         )
 
         if status:
@@ -129,7 +130,7 @@ class DatabaseService:
 
     def update_order_status(self, order_id: int, status: OrderStatus) -> Optional[Order]:
         """Update order status"""
-        order = self.db.query(Order).filter(Order.id == order_id).first()
+        order = self.db.get(Order, order_id)
         if order:
             order.status = status
             order.updated_at = datetime.utcnow()
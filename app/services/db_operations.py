@@ -45,14 +45,10 @@ def get_featured_items_from_db(db: Session = Depends(get_db)) -> List[MenuItem]:
 # Order operations
 def create_order_in_db(order_data: dict, items: List[dict], db: Session = Depends(get_db)) -> Order:
     """Create a new order in database"""
-    # Generate order number
-    last_order = db.query(Order).order_by(desc(Order.id)).first()
-    order_number = f"ORD-{(last_order.id + 1):04d}" if last_order else "ORD-0001"
-
-    order_data['order_number'] = order_number
+    # order_number is generated by the database during the INSERT
     order = Order(**order_data)
     db.add(order)
-    db.flush()  # Get order ID
+    db.flush()  # Get order ID and number
 
     # Add order items
     for item in items:
@@ -72,12 +68,12 @@ def get_orders_from_db(db: Session = Depends(get_db), limit: int = 50) -> List[O
 
 def get_order_by_id_from_db(order_id: int, db: Session = Depends(get_db)) -> Optional[Order]:
     """Get order by ID from database"""
-    return db.query(Order).filter(Order.id == order_id).first()
+    return db.get(Order, order_id)
 
 
 def update_order_status_in_db(order_id: int, status: str, db: Session = Depends(get_db)) -> Optional[Order]:
     """Update order status in database"""
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = db.get(Order, order_id)
     if order:
         order.status = status
         order.updated_at = datetime.utcnow()
@@ -94,7 +90,7 @@ def get_users_from_db(db: Session = Depends(get_db)) -> List[User]:
 
 def get_user_by_id_from_db(user_id: int, db: Session = Depends(get_db)) -> Optional[User]:
     """Get user by ID from database"""
-    return db.query(User).filter(User.id == user_id).first()
+    return db.get(User, user_id)
 
 
 # Statistics
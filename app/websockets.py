@@ -245,7 +245,7 @@ async def notify_admin_new_order(order_id: int, order_number: str, customer_name
             "order_id": order_id,
             "order_number": order_number,
             "customer_name": customer_name,
-            "total_amount": total_amount
+            "total_amount": float(total_amount)  # Numeric columns load as Decimal
         }
     })
 
@@ -0,0 +1,31 @@
+-- ============================================
+-- Convert JSON text columns to native JSONB in Production Database
+-- Run this in Supabase SQL Editor (one transaction) before deploying the JSONB models
+-- ============================================
+
+BEGIN;
+
+-- Empty strings were written where no value was set; they become NULL rather than failing the cast
+ALTER TABLE users ALTER COLUMN dietary_preferences TYPE jsonb USING NULLIF(dietary_preferences, '')::jsonb;
+ALTER TABLE users ALTER COLUMN notification_preferences TYPE jsonb USING NULLIF(notification_preferences, '')::jsonb;
+
+ALTER TABLE menu_items ALTER COLUMN ingredients TYPE jsonb USING NULLIF(ingredients, '')::jsonb;
+ALTER TABLE menu_items ALTER COLUMN allergens TYPE jsonb USING NULLIF(allergens, '')::jsonb;
+ALTER TABLE menu_items ALTER COLUMN dietary_tags TYPE jsonb USING NULLIF(dietary_tags, '')::jsonb;
+ALTER TABLE menu_items ALTER COLUMN customization_options TYPE jsonb USING NULLIF(customization_options, '')::jsonb;
+
+ALTER TABLE order_items ALTER COLUMN customizations TYPE jsonb USING NULLIF(customizations, '')::jsonb;
+
+ALTER TABLE notifications ALTER COLUMN push_notification_data TYPE jsonb USING NULLIF(push_notification_data, '')::jsonb;
+
+COMMIT;
+
+-- Verify the conversion
+SELECT table_name, column_name, udt_name
+FROM information_schema.columns
+WHERE (table_name, column_name) IN (
+    ('users', 'dietary_preferences'), ('users', 'notification_preferences'),
+    ('menu_items', 'ingredients'), ('menu_items', 'allergens'),
+    ('menu_items', 'dietary_tags'), ('menu_items', 'customization_options'),
+    ('order_items', 'customizations'), ('notifications', 'push_notification_data')
+);
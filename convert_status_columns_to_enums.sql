@@ -0,0 +1,48 @@
+-- ============================================
+-- Convert status columns to native ENUM types in Production Database
+-- Run this in Supabase SQL Editor (one transaction)
+-- ============================================
+
+BEGIN;
+
+CREATE TYPE userrole AS ENUM ('customer', 'kitchen_staff', 'counter_staff', 'manager', 'admin');
+CREATE TYPE menuitemstatus AS ENUM ('available', 'unavailable', 'out_of_stock');
+CREATE TYPE orderstatus AS ENUM ('pending_payment', 'payment_confirmed', 'preparing', 'almost_ready', 'ready_for_pickup', 'delivered', 'completed', 'cancelled');
+CREATE TYPE paymentstatus AS ENUM ('pending', 'completed', 'failed', 'refunded');
+
+-- Older seeds wrote short staff role names; blank menu statuses predate the status column
+UPDATE users SET role = 'kitchen_staff' WHERE role = 'kitchen';
+UPDATE users SET role = 'counter_staff' WHERE role = 'counter';
+UPDATE menu_items SET status = 'available' WHERE status IS NULL OR status = '';
+-- Older seeds wrote payment statuses from the previous enum; same mapping as migration 011
+UPDATE orders SET payment_status = 'completed' WHERE payment_status = 'confirmed';
+UPDATE orders SET payment_status = 'failed' WHERE payment_status = 'rejected';
+
+-- Old partial indexes compare status with text literals and would block the type change; nothing reads them
+DROP INDEX IF EXISTS ix_orders_pending;
+DROP INDEX IF EXISTS ix_orders_today;
+
+ALTER TABLE users ALTER COLUMN role DROP DEFAULT;
+ALTER TABLE users ALTER COLUMN role TYPE userrole USING role::userrole;
+ALTER TABLE users ALTER COLUMN role SET DEFAULT 'customer';
+
+ALTER TABLE menu_items ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE menu_items ALTER COLUMN status TYPE menuitemstatus USING status::menuitemstatus;
+ALTER TABLE menu_items ALTER COLUMN status SET DEFAULT 'available';
+
+ALTER TABLE orders ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE orders ALTER COLUMN status TYPE orderstatus USING status::orderstatus;
+ALTER TABLE orders ALTER COLUMN status SET DEFAULT 'pending_payment';
+
+ALTER TABLE orders ALTER COLUMN payment_status DROP DEFAULT;
+ALTER TABLE orders ALTER COLUMN payment_status TYPE paymentstatus USING payment_status::paymentstatus;
+ALTER TABLE orders ALTER COLUMN payment_status SET DEFAULT 'pending';
+
+COMMIT;
+
+-- Verify the conversion
+SELECT table_name, column_name, udt_name
+FROM information_schema.columns
+WHERE (table_name, column_name) IN (
+    ('users', 'role'), ('menu_items', 'status'), ('orders', 'status'), ('orders', 'payment_status')
+);
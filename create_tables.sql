@@ -10,6 +10,14 @@ DROP TABLE IF EXISTS orders CASCADE;
 DROP TABLE IF EXISTS menu_items CASCADE;
 DROP TABLE IF EXISTS menu_categories CASCADE;
 DROP TABLE IF EXISTS users CASCADE;
+DROP TYPE IF EXISTS userrole, menuitemstatus, orderstatus, paymentstatus;
+DROP SEQUENCE IF EXISTS order_number_seq;
+
+-- Status columns are native ENUMs: 4 bytes per row, and the domain is enforced
+CREATE TYPE userrole AS ENUM ('customer', 'kitchen_staff', 'counter_staff', 'manager', 'admin');
+CREATE TYPE menuitemstatus AS ENUM ('available', 'unavailable', 'out_of_stock');
+CREATE TYPE orderstatus AS ENUM ('pending_payment', 'payment_confirmed', 'preparing', 'almost_ready', 'ready_for_pickup', 'delivered', 'completed', 'cancelled');
+CREATE TYPE paymentstatus AS ENUM ('pending', 'completed', 'failed', 'refunded');
 
 -- Create Users Table
 CREATE TABLE users (
@@ -19,16 +27,16 @@ CREATE TABLE users (
     hashed_password VARCHAR(255),
     first_name VARCHAR(100),
     last_name VARCHAR(100),
-    role VARCHAR(13) DEFAULT 'customer',
+    role userrole DEFAULT 'customer',
     is_active BOOLEAN DEFAULT TRUE,
     is_verified BOOLEAN DEFAULT FALSE,
     profile_image VARCHAR(255),
     google_id VARCHAR(100) UNIQUE,
     facebook_id VARCHAR(100) UNIQUE,
-    dietary_preferences TEXT,
-    notification_preferences TEXT,
+    dietary_preferences JSONB,
+    notification_preferences JSONB,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     last_login TIMESTAMP WITH TIME ZONE
 );
 
@@ -36,6 +44,7 @@ CREATE INDEX idx_users_email ON users(email);
 CREATE INDEX idx_users_phone ON users(phone);
 CREATE INDEX idx_users_google_id ON users(google_id);
 CREATE INDEX idx_users_facebook_id ON users(facebook_id);
+CREATE INDEX ix_users_created_at_id ON users(created_at DESC, id DESC);
 
 -- Create Menu Categories Table
 CREATE TABLE menu_categories (
@@ -46,61 +55,66 @@ CREATE TABLE menu_categories (
     is_active BOOLEAN DEFAULT TRUE,
     icon VARCHAR(100),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 -- Create Menu Items Table
 CREATE TABLE menu_items (
     id SERIAL PRIMARY KEY,
-    name VARCHAR(200) NOT NULL,
-    description TEXT,
-    price FLOAT NOT NULL,
     category_id INTEGER REFERENCES menu_categories(id),
-    image_url VARCHAR(255),
-    thumbnail_url VARCHAR(255),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     calories INTEGER,
-    ingredients TEXT,
-    allergens TEXT,
-    dietary_tags TEXT,
-    is_available BOOLEAN DEFAULT TRUE,
-    is_featured BOOLEAN DEFAULT FALSE,
-    status VARCHAR(12),
     preparation_time INTEGER DEFAULT 15,
     spice_level INTEGER,
+    status menuitemstatus DEFAULT 'available',
+    is_available BOOLEAN DEFAULT TRUE,
+    is_featured BOOLEAN DEFAULT FALSE,
     customizable BOOLEAN DEFAULT FALSE,
-    customization_options TEXT,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE
+    price NUMERIC(10, 2) NOT NULL,
+    name VARCHAR(200) NOT NULL,
+    image_url VARCHAR(255),
+    thumbnail_url VARCHAR(255),
+    description TEXT,
+    ingredients JSONB,
+    allergens JSONB,
+    dietary_tags JSONB,
+    customization_options JSONB
 );
 
 CREATE INDEX idx_menu_items_category_id ON menu_items(category_id);
+CREATE INDEX idx_menu_items_dietary_tags ON menu_items USING GIN (dietary_tags);
+
+-- Order numbers are drawn from a sequence inside the INSERT
+CREATE SEQUENCE order_number_seq;
 
 -- Create Orders Table
 CREATE TABLE orders (
     id SERIAL PRIMARY KEY,
-    order_number VARCHAR(50) UNIQUE NOT NULL,
     customer_id INTEGER REFERENCES users(id),
-    status VARCHAR(17) DEFAULT 'pending_payment',
-    payment_status VARCHAR(9) DEFAULT 'pending',
-    subtotal FLOAT DEFAULT 0,
-    tax_amount FLOAT DEFAULT 0,
-    tip_amount FLOAT DEFAULT 0,
-    total_amount FLOAT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    estimated_ready_time TIMESTAMP WITH TIME ZONE,
+    actual_ready_time TIMESTAMP WITH TIME ZONE,
+    status orderstatus DEFAULT 'pending_payment',
+    payment_status paymentstatus DEFAULT 'pending',
+    subtotal NUMERIC(10, 2) DEFAULT 0,
+    tax_amount NUMERIC(10, 2) DEFAULT 0,
+    tip_amount NUMERIC(10, 2) DEFAULT 0,
+    total_amount NUMERIC(10, 2) NOT NULL,
+    order_number VARCHAR(20) UNIQUE NOT NULL DEFAULT 'ORD-' || lpad(nextval('order_number_seq')::text, 8, '0'),
     customer_name VARCHAR(200),
     customer_phone VARCHAR(20),
     customer_email VARCHAR(255),
-    notes TEXT,
-    estimated_ready_time TIMESTAMP WITH TIME ZONE,
-    actual_ready_time TIMESTAMP WITH TIME ZONE,
     payment_method VARCHAR(50),
     payment_reference VARCHAR(100),
     bank_transfer_receipt VARCHAR(255),
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE
+    notes TEXT
 );
 
 CREATE INDEX idx_orders_customer_id ON orders(customer_id);
-CREATE INDEX idx_orders_order_number ON orders(order_number);
+CREATE INDEX ix_orders_created_at ON orders(created_at);
+CREATE INDEX ix_orders_customer_status_created ON orders(customer_id, status, created_at);
 
 -- Create Order Items Table
 CREATE TABLE order_items (
@@ -108,9 +122,9 @@ CREATE TABLE order_items (
     order_id INTEGER REFERENCES orders(id) ON DELETE CASCADE,
     menu_item_id INTEGER REFERENCES menu_items(id),
     quantity INTEGER NOT NULL,
-    unit_price FLOAT NOT NULL,
-    total_price FLOAT NOT NULL,
-    customizations TEXT,
+    unit_price NUMERIC(10, 2) NOT NULL,
+    total_price NUMERIC(10, 2) NOT NULL,
+    customizations JSONB,
     notes TEXT
 );
 
@@ -129,7 +143,7 @@ CREATE TABLE reviews (
     is_featured BOOLEAN DEFAULT FALSE,
     helpful_count INTEGER DEFAULT 0,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 CREATE INDEX idx_reviews_customer_id ON reviews(customer_id);
@@ -145,20 +159,21 @@ CREATE TABLE notifications (
     type VARCHAR(50),
     is_read BOOLEAN DEFAULT FALSE,
     is_sent BOOLEAN DEFAULT FALSE,
-    push_notification_data TEXT,
+    push_notification_data JSONB,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     read_at TIMESTAMP WITH TIME ZONE
 );
 
 CREATE INDEX idx_notifications_user_id ON notifications(user_id);
 CREATE INDEX idx_notifications_order_id ON notifications(order_id);
+CREATE INDEX idx_notifications_user_unread_recent ON notifications(user_id, created_at DESC) WHERE is_read = false;
 
 -- Create Bank Transfer Confirmations Table
 CREATE TABLE bank_transfer_confirmations (
     id SERIAL PRIMARY KEY,
     order_id INTEGER REFERENCES orders(id),
     sender_name VARCHAR(200),
-    transfer_amount FLOAT NOT NULL,
+    transfer_amount NUMERIC(10, 2) NOT NULL,
     transfer_date TIMESTAMP WITH TIME ZONE,
     reference_number VARCHAR(100),
     confirmed_by INTEGER REFERENCES users(id),
@@ -167,7 +182,7 @@ CREATE TABLE bank_transfer_confirmations (
     receipt_image_path VARCHAR(255),
     is_confirmed BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 CREATE INDEX idx_bank_transfers_order_id ON bank_transfer_confirmations(order_id);
@@ -237,7 +252,7 @@ CREATE TABLE app_settings (
     restaurant_email VARCHAR(255) DEFAULT 'vendorr1@gmail.com',
     restaurant_address TEXT DEFAULT 'Red Brick, Faculty of Arts, University of Jos',
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 -- Insert default settings
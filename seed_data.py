@@ -11,7 +11,6 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.models import Base, User, MenuCategory, MenuItem, Order, OrderItem, UserRole, OrderStatus, PaymentStatus, MenuItemStatus
 from passlib.context import CryptContext
-import json
 
 # Create SQLite database
 DATABASE_URL = "sqlite:///./vendorr.db"
@@ -109,11 +108,11 @@ def seed_data():
             preparation_time=15,
             calories=650,
             customizable=True,
-            customization_options=json.dumps([
+            customization_options=[
                 {"name": "Extra Cheese", "price": 1.50},
                 {"name": "Bacon", "price": 2.00},
                 {"name": "Avocado", "price": 1.75}
-            ])
+            ]
         )
         db.add(burger1)
 
@@ -161,7 +160,7 @@ def seed_data():
             order_number="ORD-0001",
             customer_id=test_customer.id,
             status=OrderStatus.PREPARING,
-            payment_status=PaymentStatus.CONFIRMED,
+            payment_status=PaymentStatus.COMPLETED,
             subtotal=17.98,
             tax_amount=1.44,
             total_amount=19.42,
@@ -145,7 +145,7 @@ def init_database():
             order_number="ORD-0001",
             customer_id=test_customer.id,
             status=OrderStatus.PREPARING,
-            payment_status=PaymentStatus.CONFIRMED,
+            payment_status=PaymentStatus.COMPLETED,
             subtotal=17.98,
             tax_amount=1.44,
             total_amount=19.42,